@@ -5,9 +5,33 @@ This package contains:
 - settings.py: Application settings with validation
 - logging_config.py: Centralized logging configuration
 - users.py: User authentication database
+
+Public names are resolved lazily (PEP 562) so importing a single submodule,
+e.g. ``config.users``, does not build the Pydantic ``Settings`` schema.
 """
 
-from .settings import get_settings
-from .logging_config import setup_logging
+import importlib
+
+_LAZY_ATTRS = {
+    "get_settings": ".settings",
+    "reset_settings": ".settings",
+    "setup_logging": ".logging_config",
+    "ensure_logging": ".logging_config",
+}
+
+__all__ = ["get_settings", "reset_settings", "setup_logging", "ensure_logging"]
+
+
+def __getattr__(name: str):
+    """Import public configuration helpers on first access."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
-__all__ = ["get_settings", "setup_logging"]
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
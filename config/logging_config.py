@@ -2,13 +2,47 @@
 Logging configuration for Multi-Technical-Alerts.
 
 Provides centralized logging setup with file and console handlers.
+Handlers run on a background QueueListener so emitting threads never block on I/O.
 """
 
+import atexit
+import functools
 import logging
+import logging.handlers
+import queue
 from pathlib import Path
 from typing import Optional
 
 
+# Level name → numeric level (avoids getattr on the logging module)
+_LEVELS = {
+    "CRITICAL": logging.CRITICAL,
+    "ERROR": logging.ERROR,
+    "WARNING": logging.WARNING,
+    "INFO": logging.INFO,
+    "DEBUG": logging.DEBUG,
+    "NOTSET": logging.NOTSET,
+}
+
+# Background listener that owns the file/console handlers (replaced on each setup_logging call)
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_listener() -> None:
+    """Flush pending records and close the handlers of the active listener."""
+    global _listener
+    if _listener is None:
+        return
+    
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+
+atexit.register(_stop_listener)
+
+
 def setup_logging(
     log_file: Optional[str] = None,
     level: str = "INFO",
@@ -35,7 +69,7 @@ def setup_logging(
     log_path = log_directory / log_file
     
     # Convert string level to logging constant
-    numeric_level = getattr(logging, level.upper(), logging.INFO)
+    numeric_level = _LEVELS.get(level.upper(), logging.INFO)
     
     # Create logger
     logger = logging.getLogger("multi_technical_alerts")
@@ -43,6 +77,7 @@ def setup_logging(
     
     # Remove existing handlers to avoid duplicates
     logger.handlers.clear()
+    _stop_listener()
     
     # Create formatters
     detailed_formatter = logging.Formatter(
@@ -59,19 +94,53 @@ def setup_logging(
     file_handler = logging.FileHandler(log_path, encoding='utf-8')
     file_handler.setLevel(numeric_level)
     file_handler.setFormatter(detailed_formatter)
-    logger.addHandler(file_handler)
     
     # Console handler (simple logging)
     console_handler = logging.StreamHandler()
     console_handler.setLevel(numeric_level)
     console_handler.setFormatter(simple_formatter)
-    logger.addHandler(console_handler)
+    
+    # Emitting threads only enqueue records; the listener thread does the I/O
+    global _listener
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _listener.start()
     
     logger.info(f"Logging configured: level={level}, file={log_path}")
     
     return logger
 
 
+def ensure_logging(
+    log_file: Optional[str] = None,
+    level: str = "INFO",
+    log_dir: str = "logs"
+) -> logging.Logger:
+    """
+    Configure application-wide logging unless it is already configured.
+    
+    Lets entry points (main.py, notebooks) own the log file while library code
+    such as run_full_pipeline only configures logging when run standalone.
+    
+    Args:
+        log_file: Name of log file used if logging is not yet configured
+        level: Logging level used if logging is not yet configured
+        log_dir: Directory for log files
+    
+    Returns:
+        Application logger instance
+    """
+    logger = logging.getLogger("multi_technical_alerts")
+    if logger.handlers:
+        return logger
+    
+    return setup_logging(log_file=log_file, level=level, log_dir=log_dir)
+
+
+@functools.cache
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for a specific module.
@@ -4,9 +4,11 @@ Application settings for Multi-Technical-Alerts.
 Uses Pydantic Settings for configuration management with environment variable support.
 """
 
+import functools
+from functools import cached_property
 from pathlib import Path
-from typing import List
-from pydantic import Field, field_validator
+from typing import List, Set
+from pydantic import Field, PrivateAttr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -65,6 +67,8 @@ class Settings(BaseSettings):
     # Clients
     clients: List[str] = Field(default=["CDA", "EMIN"], description="List of client names")
     
+    _dirs_ready: bool = PrivateAttr(default=False)
+    
     @field_validator("data_root", "logs_dir", mode="before")
     @classmethod
     def ensure_path(cls, v):
@@ -81,24 +85,41 @@ class Settings(BaseSettings):
             return [c.strip() for c in v.split(",")]
         return v
     
+    @cached_property
+    def bronze_dir(self) -> Path:
+        """Bronze layer root directory (computed once)."""
+        return self.data_root / "bronze"
+    
+    @cached_property
+    def silver_dir(self) -> Path:
+        """Silver layer root directory (computed once)."""
+        return self.data_root / "silver"
+    
+    @cached_property
+    def golden_dir(self) -> Path:
+        """Golden layer root directory (computed once)."""
+        return self.data_root / "golden"
+    
     def get_bronze_path(self, client: str) -> Path:
         """Get bronze (raw) data path for a client."""
-        return self.data_root / "bronze" / client.lower()
+        return self.bronze_dir / client.lower()
     
     def get_silver_path(self, client: str) -> Path:
         """Get silver layer harmonized data path for a client."""
-        return self.data_root / "silver" / f"{client.upper()}.parquet"
+        return self.silver_dir / f"{client.upper()}.parquet"
     
     def get_golden_path(self, client: str) -> Path:
         """Get golden layer output path for a specific client."""
-        path = self.data_root / "golden" / client.lower()
-        path.mkdir(parents=True, exist_ok=True)
-        return path
+        return self.golden_dir / client.lower()
     
     def get_classified_reports_path(self, client: str) -> Path:
         """Get classified reports path (Golden layer)."""
         return self.get_golden_path(client) / "classified.parquet"
     
+    def get_latest_samples_path(self, client: str) -> Path:
+        """Get latest samples per component path (Golden layer)."""
+        return self.get_golden_path(client) / "latest_samples.parquet"
+    
     def get_machine_status_path(self, client: str) -> Path:
         """Get machine status path (Golden layer)."""
         return self.get_golden_path(client) / "machine_status.parquet"
@@ -108,30 +129,32 @@ class Settings(BaseSettings):
         return self.get_golden_path(client) / "stewart_limits.parquet"
     
     def create_directories(self) -> None:
-        """Create necessary directories if they don't exist."""
-        # Create logs directory
-        self.logs_dir.mkdir(parents=True, exist_ok=True)
+        """Create necessary directories if they don't exist (no-op after the first call)."""
+        if self._dirs_ready:
+            return
+        
+        # Logs and Silver layer (harmonized data)
+        directories: Set[Path] = {self.logs_dir, self.silver_dir}
         
-        # Create data directories
         for client in self.clients:
-            # Bronze layer (raw data)
-            self.get_bronze_path(client).mkdir(parents=True, exist_ok=True)
-            
-            # Golden layer (analysis-ready outputs) - per client
-            self.get_golden_path(client).mkdir(parents=True, exist_ok=True)
+            # Bronze layer (raw data) and Golden layer (analysis-ready outputs) - per client
+            directories.add(self.get_bronze_path(client))
+            directories.add(self.get_golden_path(client))
+        
+        for directory in directories:
+            directory.mkdir(parents=True, exist_ok=True)
         
-        # Silver layer (harmonized data)
-        (self.data_root / "silver").mkdir(parents=True, exist_ok=True)
+        self._dirs_ready = True
 
 
-# Global settings instance
-_settings = None
+@functools.cache
+def get_settings() -> Settings:
+    """Get global settings instance (singleton, built once per process)."""
+    settings = Settings()
+    settings.create_directories()
+    return settings
 
 
-def get_settings() -> Settings:
-    """Get global settings instance (singleton pattern)."""
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-        _settings.create_directories()
-    return _settings
+def reset_settings() -> None:
+    """Drop the cached settings instance so the next call re-reads the environment."""
+    get_settings.cache_clear()
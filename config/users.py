@@ -5,10 +5,12 @@ Contains user credentials and permissions for dashboard access.
 """
 
 import hashlib
-from typing import Dict, List
+import hmac
+import types
+from typing import Any, Mapping, Sequence
 
 
-def hash_password(password: str) -> str:
+def hash_password(password: str) -> bytes:
     """
     Hash a password using SHA-256.
     
@@ -16,36 +18,44 @@ def hash_password(password: str) -> str:
         password: Plain text password
     
     Returns:
-        Hexadecimal hash string
+        Raw 32-byte digest
     """
-    return hashlib.sha256(password.encode()).hexdigest()
+    return hashlib.sha256(password.encode()).digest()
 
 
 # User database
-# Format: {username: {"password": hashed_password, "name": display_name, "clients": [allowed_clients]}}
-USERS: Dict[str, Dict[str, any]] = {
-    "admin": {
+# Format: {username: {"password": sha256_digest_bytes, "name": display_name, "clients": (allowed_clients)}}
+# Read-only views and tuples all the way down, so the credential table can't be mutated at runtime
+USERS: Mapping[str, Mapping[str, Any]] = types.MappingProxyType({
+    "admin": types.MappingProxyType({
         "password": hash_password("admin123"),  # Change in production!
         "name": "Administrator",
-        "clients": ["CDA", "EMIN"],  # Access to all clients
+        "clients": ("CDA", "EMIN"),  # Access to all clients
         "role": "admin"
-    },
-    "cda_user": {
+    }),
+    "cda_user": types.MappingProxyType({
         "password": hash_password("cda123"),  # Change in production!
         "name": "CDA User",
-        "clients": ["CDA"],  # Only CDA data
+        "clients": ("CDA",),  # Only CDA data
         "role": "client"
-    },
-    "emin_user": {
+    }),
+    "emin_user": types.MappingProxyType({
         "password": hash_password("emin123"),  # Change in production!
         "name": "EMIN User",
-        "clients": ["EMIN"],  # Only EMIN data
+        "clients": ("EMIN",),  # Only EMIN data
         "role": "client"
-    }
-}
+    })
+})
 
 
-def get_user(username: str) -> Dict[str, any] | None:
+# Shared empty result for users without client access
+_NO_CLIENTS: Sequence[str] = ()
+
+# Placeholder digest compared against when the username is not found
+_UNKNOWN_USER_DIGEST = bytes(32)
+
+
+def get_user(username: str) -> Mapping[str, Any] | None:
     """
     Get user information by username.
     
@@ -53,7 +63,7 @@ def get_user(username: str) -> Dict[str, any] | None:
         username: Username to lookup
     
     Returns:
-        User dict or None if not found
+        Read-only user mapping or None if not found
     """
     return USERS.get(username)
 
@@ -70,13 +80,15 @@ def verify_user(username: str, password: str) -> bool:
         True if credentials valid, False otherwise
     """
     user = get_user(username)
-    if user is None:
-        return False
     
-    return user["password"] == hash_password(password)
+    # Unknown usernames still hash and compare, so timing doesn't reveal which usernames exist
+    expected = user["password"] if user is not None else _UNKNOWN_USER_DIGEST
+    matches = hmac.compare_digest(expected, hash_password(password))
+    
+    return user is not None and matches
 
 
-def get_user_clients(username: str) -> List[str]:
+def get_user_clients(username: str) -> Sequence[str]:
     """
     Get list of clients a user can access.
     
@@ -84,13 +96,13 @@ def get_user_clients(username: str) -> List[str]:
         username: Username
     
     Returns:
-        List of client names (empty if user not found)
+        Sequence of client names (empty if user not found)
     """
     user = get_user(username)
     if user is None:
-        return []
+        return _NO_CLIENTS
     
-    return user.get("clients", [])
+    return user.get("clients", _NO_CLIENTS)
 
 
 def is_admin(username: str) -> bool:
@@ -9,7 +9,6 @@ import os
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
-from openai import OpenAI
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -14,8 +14,6 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.pipeline.full_pipeline import run_full_pipeline
-
 
 def main():
     """Parse arguments and run pipeline."""
@@ -53,6 +51,9 @@ def main():
     
     print(f"Running pipeline with arguments: {args}")
     
+    # Imported after argument parsing so --help doesn't pay for pandas/openai/boto3
+    from src.pipeline.full_pipeline import run_full_pipeline
+    
     # Run pipeline
     results = run_full_pipeline(
         clients=args.clients,
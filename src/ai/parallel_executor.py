@@ -6,11 +6,12 @@ Multi-threaded processing of AI recommendations for multiple samples.
 
 import pandas as pd
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, List
+from typing import Dict, List, Optional
 from tqdm import tqdm
 from openai import OpenAI
 from src.utils.logger import get_logger
-from src.ai.recommendation_service import orchestrate_comment
+from src.data.schemas import get_essay_columns
+from src.ai.recommendation_service import build_sample_positions, orchestrate_comment
 
 logger = get_logger(__name__)
 
@@ -20,7 +21,9 @@ def process_single_sample(
     df: pd.DataFrame,
     limits: Dict,
     openai_client: OpenAI,
-    essays_list: List[str]
+    essays_list: List[str],
+    threshold_cache: Optional[Dict] = None,
+    sample_positions: Optional[Dict] = None
 ) -> Dict:
     """
     Process a single sample (wrapper for orchestrate_comment).
@@ -31,6 +34,8 @@ def process_single_sample(
         limits: Stewart Limits
         openai_client: OpenAI client
         essays_list: Essay columns
+        threshold_cache: Shared per-machine/component threshold cache
+        sample_positions: Shared sampleNumber → row position map
     
     Returns:
         Result dictionary
@@ -41,7 +46,9 @@ def process_single_sample(
             sample_number=sample_number,
             limits=limits,
             openai_client=openai_client,
-            essays_list=essays_list
+            essays_list=essays_list,
+            threshold_cache=threshold_cache,
+            sample_positions=sample_positions
         )
         return result
     
@@ -79,19 +86,23 @@ def generate_all_recommendations(
     
     # Auto-detect essay columns if not provided
     if essays_list is None:
-        metadata_cols = {
-            'client', 'sampleNumber', 'sampleDate', 'unitId', 'machineName', 
-            'machineModel', 'machineBrand', 'machineHours', 'machineSerialNumber',
-            'componentName', 'componentHours', 'componentSerialNumber',
-            'oilMeter', 'oilBrand', 'oilType', 'oilWeight',
-            'previousSampleNumber', 'previousSampleDate', 'daysSincePrevious',
-            'group_element'
-        }
-        essays_list = [col for col in df.columns if col not in metadata_cols]
+        essays_list = get_essay_columns(df)
         logger.info(f"Auto-detected {len(essays_list)} essay columns")
     
-    # Get list of sample numbers
-    sample_numbers = df['sampleNumber'].unique().tolist()
+    # Get list of sample numbers (samples already classified as Normal never get an
+    # AI recommendation, so they are not resubmitted and keep their classification)
+    if 'report_status' in df.columns:
+        pending = df['report_status'].to_numpy() != 'Normal'
+        sample_numbers = df.loc[pending, 'sampleNumber'].unique().tolist()
+        logger.info(f"Skipping {len(df) - int(pending.sum())} samples already classified as Normal")
+    else:
+        sample_numbers = df['sampleNumber'].unique().tolist()
+    
+    # Thresholds per machine/component are built once and shared by all workers
+    threshold_cache = {}
+    
+    # Row positions are indexed once so each worker finds its sample by hash lookup
+    sample_positions = build_sample_positions(df)
     
     # Process in parallel
     results = []
@@ -105,7 +116,9 @@ def generate_all_recommendations(
                 df,
                 limits,
                 openai_client,
-                essays_list
+                essays_list,
+                threshold_cache,
+                sample_positions
             ): sample_number
             for sample_number in sample_numbers
         }
@@ -130,6 +143,8 @@ def generate_all_recommendations(
     
     # Convert results to DataFrame
     results_df = pd.DataFrame(results)
+    if results_df.empty:
+        results_df = pd.DataFrame({'sampleNumber': pd.Series(dtype=df['sampleNumber'].dtype)})
     
     # Merge with original DataFrame
     output_df = df.merge(
@@ -145,10 +160,33 @@ def generate_all_recommendations(
         'breached_essays', 'ai_recommendation', 'ai_generated_at'
     ]
     
+    # Only processed samples take the generated values; skipped ones keep their own
+    # (assigned by row so the NaN the merge leaves on skipped rows never reaches a column
+    # and integer columns keep their dtype)
+    processed = output_df['sampleNumber'].isin(results_df['sampleNumber']).to_numpy()
+    
     for col in classification_cols:
-        if f'{col}_generated' in output_df.columns:
-            output_df[col] = output_df[f'{col}_generated']
-            output_df = output_df.drop(columns=[f'{col}_generated'])
+        generated = f'{col}_generated'
+        if generated in output_df.columns:
+            if output_df[generated].dtype == object and output_df[col].dtype != object:
+                # Lists/text must not be written into a numeric (e.g. all-missing) column
+                output_df[col] = output_df[col].astype(object)
+            output_df.loc[processed, col] = output_df.loc[processed, generated]
+        elif col not in output_df.columns:
+            output_df[col] = None
+    
+    # Missing AI text is None (not NaN), as for samples that never get a recommendation
+    ai_recommendation = output_df['ai_recommendation'].astype(object)
+    output_df['ai_recommendation'] = ai_recommendation.where(ai_recommendation.notna(), None)
+    
+    # Drop all suffixed columns at once (each drop copies the whole frame); result fields
+    # other than the classification ones (unitId, sampleDate, ...) are only present for
+    # processed samples, so the input's own columns are kept for those too
+    generated_cols = [
+        f'{col}_generated' for col in results_df.columns
+        if col != 'sampleNumber' and col in df.columns
+    ]
+    output_df = output_df.drop(columns=generated_cols)
     
     logger.info("Results merged with original DataFrame")
     
@@ -5,7 +5,7 @@ Contains system prompt, few-shot examples, and prompt generation for OpenAI.
 """
 
 import pandas as pd
-from typing import List, Dict
+from typing import List, Dict, Mapping
 
 
 # System prompt defining AI role and constraints
@@ -66,14 +66,14 @@ Se sugiere priorizar intervención mecánica y efectuar cambio de lubricante, ju
 
 
 def create_analysis_prompt(
-    sample: pd.Series,
+    sample: pd.Series | Mapping,
     breached_essays: pd.DataFrame
 ) -> str:
     """
     Create analysis prompt for a specific oil sample.
     
     Args:
-        sample: Series with sample data (must include componentName, machineName, machineModel)
+        sample: Series or dict with sample data (must include componentName, machineName, machineModel)
         breached_essays: DataFrame with essays that exceeded thresholds
     
     Returns:
@@ -102,7 +102,7 @@ Los valores de la muestra son:
 
 
 def create_full_messages(
-    sample: pd.Series,
+    sample: pd.Series | Mapping,
     breached_essays: pd.DataFrame
 ) -> List[Dict[str, str]]:
     """
@@ -111,7 +111,7 @@ def create_full_messages(
     Includes system prompt, few-shot examples, and user prompt.
     
     Args:
-        sample: Sample data
+        sample: Sample data (Series or dict)
         breached_essays: Breached essays DataFrame
     
     Returns:
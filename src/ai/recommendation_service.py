@@ -4,13 +4,15 @@ OpenAI recommendation service for Multi-Technical-Alerts.
 Generates AI-powered maintenance recommendations based on oil analysis results.
 """
 
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from typing import Dict, Optional
 from openai import OpenAI
 from src.utils.logger import get_logger
+from src.data.schemas import get_essay_columns
 from src.ai.prompts import create_full_messages
-from src.processing.classification import classify_essays
+from src.processing.classification import classify_essays_records, classify_report
 
 logger = get_logger(__name__)
 
@@ -53,12 +55,28 @@ def create_recommendation(
         return f"Error generando recomendación: {str(e)}"
 
 
+def build_sample_positions(df: pd.DataFrame) -> Dict:
+    """
+    Map each sampleNumber to the row position of its first occurrence in df.
+    
+    Args:
+        df: DataFrame with oil samples
+    
+    Returns:
+        Dictionary of sampleNumber → positional index
+    """
+    first = ~df['sampleNumber'].duplicated().to_numpy()
+    return dict(zip(df['sampleNumber'].to_numpy()[first].tolist(), np.flatnonzero(first).tolist()))
+
+
 def orchestrate_comment(
     df: pd.DataFrame,
     sample_number: str,
     limits: Dict,
     openai_client: OpenAI,
-    essays_list: Optional[list] = None
+    essays_list: Optional[list] = None,
+    threshold_cache: Optional[Dict] = None,
+    sample_positions: Optional[Dict] = None
 ) -> Dict:
     """
     Orchestrate complete classification and AI recommendation for a single sample.
@@ -71,45 +89,47 @@ def orchestrate_comment(
         limits: Stewart Limits dictionary
         openai_client: OpenAI client instance
         essays_list: List of essay columns (if None, auto-detected)
+        threshold_cache: Optional dict reused across samples to memoize thresholds
+            per machine/component (see classify_essays_records)
+        sample_positions: Optional sampleNumber → row position map (see
+            build_sample_positions); avoids scanning sampleNumber per sample
     
     Returns:
         Dictionary with complete report metadata
     """
-    logger.info(f"Orchestrating comment for sample {sample_number}")
+    logger.debug(f"Orchestrating comment for sample {sample_number}")
     
     # Get sample data
-    sample = df[df['sampleNumber'] == sample_number].iloc[0]
+    if sample_positions is not None:
+        position = sample_positions[sample_number]
+    else:
+        # (plain numpy comparison: no boolean Series / index alignment, no filtered copy of df)
+        position = (df['sampleNumber'].to_numpy() == sample_number).nonzero()[0][0]
+    # Plain dict: the classifier and prompt builder do many .get() lookups per sample
+    sample = df.iloc[position].to_dict()
     
     # Auto-detect essay columns if not provided
     if essays_list is None:
-        # Exclude metadata columns
-        metadata_cols = {
-            'client', 'sampleNumber', 'sampleDate', 'unitId', 'machineName', 
-            'machineModel', 'machineBrand', 'machineHours', 'machineSerialNumber',
-            'componentName', 'componentHours', 'componentSerialNumber',
-            'oilMeter', 'oilBrand', 'oilType', 'oilWeight',
-            'previousSampleNumber', 'previousSampleDate', 'daysSincePrevious',
-            'group_element', 'essays_broken', 'severity_score', 'report_status',
-            'breached_essays', 'ai_recommendation', 'ai_generated_at'
-        }
-        essays_list = [col for col in df.columns if col not in metadata_cols]
-    
-    # Classify essays
-    essays_broken_df, severity_score = classify_essays(sample, limits, essays_list)
+        # Exclude metadata columns (memoized per column layout)
+        essays_list = get_essay_columns(df)
+    
+    # Classify essays (records feed breached_essays directly; no DataFrame round trip)
+    breached_essays, severity_score = classify_essays_records(
+        sample, limits, essays_list, threshold_cache=threshold_cache
+    )
     
     # Classify report
-    from src.processing.classification import classify_report
-    report_status = classify_report(len(essays_broken_df), severity_score)
+    report_status = classify_report(len(breached_essays), severity_score)
     
     # Generate AI recommendation only for non-Normal reports
     ai_recommendation = None
     ai_generated_at = None
     
-    if report_status != 'Normal' and not essays_broken_df.empty:
-        logger.info(f"Generating AI recommendation for {report_status} report")
+    if report_status != 'Normal' and breached_essays:
+        logger.debug(f"Generating AI recommendation for {report_status} report")
         
-        # Create messages
-        messages = create_full_messages(sample, essays_broken_df)
+        # Create messages (the prompt renders breached essays as a table)
+        messages = create_full_messages(sample, pd.DataFrame(breached_essays))
         
         # Generate recommendation
         ai_recommendation = create_recommendation(
@@ -119,7 +139,7 @@ def orchestrate_comment(
         
         ai_generated_at = datetime.now()
     else:
-        logger.info(f"Skipping AI recommendation for {report_status} report")
+        logger.debug(f"Skipping AI recommendation for {report_status} report")
     
     # Create result dictionary
     result = {
@@ -128,14 +148,14 @@ def orchestrate_comment(
         'componentName': sample.get('componentName'),
         'sampleDate': sample.get('sampleDate'),
         'client': sample.get('client'),
-        'essays_broken': len(essays_broken_df),
+        'essays_broken': len(breached_essays),
         'severity_score': severity_score,
         'report_status': report_status,
-        'breached_essays': essays_broken_df.to_dict('records') if not essays_broken_df.empty else [],
+        'breached_essays': breached_essays,
         'ai_recommendation': ai_recommendation,
         'ai_generated_at': ai_generated_at
     }
     
-    logger.info(f"Orchestration complete: {report_status} with {len(essays_broken_df)} breached essays")
+    logger.debug(f"Orchestration complete: {report_status} with {len(breached_essays)} breached essays")
     
     return result
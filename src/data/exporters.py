@@ -7,11 +7,56 @@ Export processed data from Silver and Gold layers.
 import pandas as pd
 import json
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Low-cardinality key columns of Silver/Gold reports, held as categoricals in memory
+# (exported files keep them as plain strings, see export_to_parquet)
+CATEGORICAL_KEY_COLUMNS = (
+    'client', 'unitId', 'machineName', 'componentName', 'componentNameNormalized', 'report_status'
+)
+
+# Row order of Gold layer reports: each unit/component history is contiguous and
+# chronological, so its latest sample is the last row of the run
+REPORT_SORT_COLUMNS = ['unitId', 'componentName', 'sampleDate']
+
+
+def to_categorical(df: pd.DataFrame, columns: Tuple[str, ...]) -> pd.DataFrame:
+    """
+    Cast the given columns (when present) to Categorical.
+    
+    Groupby/compare/sort on these columns then works on integer codes (in memory
+    only; export_to_parquet writes them back as plain strings).
+    
+    Args:
+        df: DataFrame to convert (not modified)
+        columns: Column names to cast
+    
+    Returns:
+        DataFrame with categorical columns
+    """
+    dtypes = {col: 'category' for col in columns if col in df.columns}
+    return df.astype(dtypes) if dtypes else df
+
+
+def from_categorical(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cast every Categorical column back to plain object values.
+    
+    Exported files keep the string column types of the data contracts, so readers
+    grouping on key columns do not get unobserved category combinations.
+    
+    Args:
+        df: DataFrame to convert (not modified)
+    
+    Returns:
+        DataFrame without categorical columns
+    """
+    dtypes = {col: object for col, dtype in df.dtypes.items() if isinstance(dtype, pd.CategoricalDtype)}
+    return df.astype(dtypes) if dtypes else df
+
 
 def export_to_parquet(
     df: pd.DataFrame,
@@ -21,6 +66,8 @@ def export_to_parquet(
     """
     Export DataFrame to Parquet format.
     
+    Categorical columns are written as plain strings (see from_categorical).
+    
     Args:
         df: DataFrame to export
         output_path: Path to output file
@@ -31,7 +78,7 @@ def export_to_parquet(
     
     logger.info(f"Exporting {len(df)} rows to {output_path}")
     
-    df.to_parquet(output_path, compression=compression, index=False)
+    from_categorical(df).to_parquet(output_path, compression=compression, index=False)
     
     logger.info(f"Export complete: {output_path.stat().st_size / 1024:.2f} KB")
 
@@ -108,6 +155,11 @@ def export_classified_reports(
     client_name = client or "unknown"
     logger.info(f"Exporting classified reports for {client_name} to Gold layer")
     
+    # Keep the unit/component/date order (Silver data normally arrives already sorted)
+    sort_cols = [col for col in REPORT_SORT_COLUMNS if col in df.columns]
+    if sort_cols and not pd.MultiIndex.from_frame(df[sort_cols]).is_monotonic_increasing:
+        df = df.sort_values(sort_cols, kind='stable')
+    
     # Export as Parquet (primary Gold layer output)
     export_to_parquet(df, output_path)
     
@@ -128,6 +180,20 @@ def export_machine_status(
     export_to_parquet(df, output_path)
 
 
+def export_latest_samples(
+    df: pd.DataFrame,
+    output_path: str | Path
+) -> None:
+    """
+    Export latest sample per unit/component (derived from classified reports).
+    
+    Args:
+        df: DataFrame with one row per unit/component
+        output_path: Path to output file
+    """
+    export_to_parquet(df, output_path)
+
+
 def export_component_summary(
     df: pd.DataFrame,
     output_path: str | Path
@@ -167,26 +233,24 @@ def export_stewart_limits_parquet(
     
     logger.info("Converting Stewart Limits to DataFrame")
     
-    # Flatten nested dictionary
-    rows = []
-    for client, machines in limits.items():
-        for machine, components in machines.items():
-            for component, essays in components.items():
-                for essay, thresholds in essays.items():
-                    # Thresholds should be a dict with threshold_normal/alert/critic keys
-                    if isinstance(thresholds, dict) and 'threshold_normal' in thresholds:
-                        rows.append({
-                            'client': client,
-                            'machine': machine,
-                            'component': component,
-                            'essay': essay,
-                            'threshold_normal': thresholds.get('threshold_normal'),
-                            'threshold_alert': thresholds.get('threshold_alert'),
-                            'threshold_critic': thresholds.get('threshold_critic')
-                        })
-                    else:
-                        # Skip metadata or invalid entries (e.g., 'count' fields)
-                        logger.debug(f"Skipping non-threshold entry {client}/{machine}/{component}/{essay}")
+    # Flatten nested dictionary (thresholds should be a dict with threshold_normal/alert/critic
+    # keys; metadata or invalid entries such as 'count' fields are skipped)
+    rows = [
+        {
+            'client': client,
+            'machine': machine,
+            'component': component,
+            'essay': essay,
+            'threshold_normal': thresholds.get('threshold_normal'),
+            'threshold_alert': thresholds.get('threshold_alert'),
+            'threshold_critic': thresholds.get('threshold_critic')
+        }
+        for client, machines in limits.items()
+        for machine, components in machines.items()
+        for component, essays in components.items()
+        for essay, thresholds in essays.items()
+        if isinstance(thresholds, dict) and 'threshold_normal' in thresholds
+    ]
     
     df = pd.DataFrame(rows)
     
@@ -4,33 +4,51 @@ Data loaders for Multi-Technical-Alerts.
 Load raw data from Bronze layer (data/oil/raw/).
 """
 
+import functools
 import pandas as pd
 import json
+import warnings
 from pathlib import Path
 from typing import Dict, List
 
-from yaml import warnings
 from src.utils.logger import get_logger
-from src.utils.file_utils import list_excel_files, safe_read_excel, safe_read_parquet
+from src.utils.file_utils import list_excel_files, read_parquet_cached, safe_read_excel, safe_read_parquet
 
 logger = get_logger(__name__)
 
+# Columns of stewart_limits.parquet needed to rebuild the nested limits dict
+STEWART_LIMITS_COLUMNS = (
+    'client', 'machine', 'component', 'essay',
+    'threshold_normal', 'threshold_alert', 'threshold_critic'
+)
+
+
+@functools.lru_cache(maxsize=4)
+def _read_essays_mapping(path_str: str, mtime_ns: int) -> pd.DataFrame:
+    """Parse the essays mapping workbook; keyed on mtime so an edited file is a cache miss."""
+    df = pd.read_excel(path_str, engine='openpyxl')
+    # Drop rows with incomplete mappings
+    return df.dropna()
+
 
 def load_essays_mapping(file_path: str | Path = "essays_elements.xlsx") -> pd.DataFrame:
     """
     Load essays mapping table for harmonizing column names.
     
+    The parsed workbook is cached while the file is unchanged, so processing several
+    clients in one run only decodes the .xlsx once. The returned DataFrame is shared
+    and must not be modified in place.
+    
     Args:
         file_path: Path to essays mapping Excel file
     
     Returns:
         DataFrame with Element → ElementNameSpanish mapping
     """
+    file_path = Path(file_path)
     logger.info(f"Loading essays mapping from {file_path}")
     
-    df = pd.read_excel(file_path, engine='openpyxl')
-    # Drop rows with incomplete mappings
-    df = df.dropna()
+    df = _read_essays_mapping(str(file_path.resolve()), file_path.stat().st_mtime_ns)
     
     logger.info(f"Loaded {len(df)} essay mappings")
     return df
@@ -46,7 +64,6 @@ def load_cda_data(raw_folder: str | Path) -> pd.DataFrame:
     Returns:
         Concatenated DataFrame from all Excel files
     """
-    import warnings
     warnings.filterwarnings("ignore", message="Workbook contains no default style")
     
     raw_folder = Path(raw_folder)
@@ -121,28 +138,21 @@ def load_stewart_limits(file_path: str | Path) -> Dict:
         logger.warning(f"Stewart Limits file not found: {file_path}")
         return {}
     
-    # Load from Parquet
-    df = pd.read_parquet(file_path)
+    # Load from Parquet (cached while the file is unchanged), decoding only the needed columns
+    df = read_parquet_cached(file_path, columns=STEWART_LIMITS_COLUMNS)
     
-    # Reconstruct nested dictionary structure
+    # Reconstruct nested dictionary structure (column-wise, no per-row Series)
     limits = {}
-    for _, row in df.iterrows():
-        client = row['client']
-        machine = row['machine']
-        component = row['component']
-        essay = row['essay']
-        
-        if client not in limits:
-            limits[client] = {}
-        if machine not in limits[client]:
-            limits[client][machine] = {}
-        if component not in limits[client][machine]:
-            limits[client][machine][component] = {}
-        
-        limits[client][machine][component][essay] = {
-            'threshold_normal': row['threshold_normal'],
-            'threshold_alert': row['threshold_alert'],
-            'threshold_critic': row['threshold_critic']
+    if df.empty:
+        logger.info("Stewart Limits file is empty")
+        return limits
+    
+    rows = zip(*(df[col].tolist() for col in STEWART_LIMITS_COLUMNS))
+    for client, machine, component, essay, normal, alert, critic in rows:
+        limits.setdefault(client, {}).setdefault(machine, {}).setdefault(component, {})[essay] = {
+            'threshold_normal': normal,
+            'threshold_alert': alert,
+            'threshold_critic': critic
         }
     
     logger.info(f"Loaded Stewart Limits for {len(limits)} clients")
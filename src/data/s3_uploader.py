@@ -10,10 +10,19 @@ from typing import Optional
 from botocore.exceptions import NoCredentialsError, PartialCredentialsError, ClientError
 
 from src.utils.logger import get_logger
-from config.settings import get_settings
+from config.settings import Settings, get_settings
 
 logger = get_logger(__name__)
 
+# Golden layer files per client: result name → Settings path builder
+# (S3 keys mirror the local file names under golden/{client}/)
+GOLDEN_FILES = (
+    ('classified', Settings.get_classified_reports_path),
+    ('latest_samples', Settings.get_latest_samples_path),
+    ('machine_status', Settings.get_machine_status_path),
+    ('stewart_limits', Settings.get_stewart_limits_path),
+)
+
 
 class S3Uploader:
     """Handles uploading data to AWS S3."""
@@ -67,8 +76,12 @@ class S3Uploader:
         
         file_path = Path(file_path)
         
-        if not file_path.exists():
-            logger.error(f"File not found: {file_path}")
+        # A single stat both checks existence and gives the size for the log line
+        # (OSError also covers unreadable paths, so they never escape an upload loop)
+        try:
+            file_size_kb = file_path.stat().st_size / 1024
+        except OSError as e:
+            logger.error(f"Cannot access file {file_path}: {e}")
             return False
         
         # Generate S3 key if not provided
@@ -84,12 +97,11 @@ class S3Uploader:
                 s3_key
             )
             
-            file_size_kb = file_path.stat().st_size / 1024
             logger.info(f"✓ Successfully uploaded {file_path.name} ({file_size_kb:.2f} KB)")
             return True
             
-        except FileNotFoundError:
-            logger.error(f"File not found: {file_path}")
+        except OSError as e:
+            logger.error(f"Cannot read file {file_path}: {e}")
             return False
         except NoCredentialsError:
             logger.error("AWS credentials not available")
@@ -130,21 +142,11 @@ class S3Uploader:
             Dictionary with upload status for each file
         """
         results = {}
+        golden_prefix = f"{self.settings.aws_s3_prefix}golden/{client.lower()}/"
         
-        # Upload classified reports
-        classified_path = self.settings.get_classified_reports_path(client)
-        s3_key = f"{self.settings.aws_s3_prefix}golden/{client.lower()}/classified.parquet"
-        results['classified'] = self.upload_file(classified_path, s3_key)
-        
-        # Upload machine status
-        machine_status_path = self.settings.get_machine_status_path(client)
-        s3_key = f"{self.settings.aws_s3_prefix}golden/{client.lower()}/machine_status.parquet"
-        results['machine_status'] = self.upload_file(machine_status_path, s3_key)
-        
-        # Upload Stewart Limits
-        stewart_limits_path = self.settings.get_stewart_limits_path(client)
-        s3_key = f"{self.settings.aws_s3_prefix}golden/{client.lower()}/stewart_limits.parquet"
-        results['stewart_limits'] = self.upload_file(stewart_limits_path, s3_key)
+        for name, get_path in GOLDEN_FILES:
+            local_path = get_path(self.settings, client)
+            results[name] = self.upload_file(local_path, golden_prefix + local_path.name)
         
         return results
     
@@ -7,12 +7,47 @@ Defines schemas for:
 - MachineStatus: Machine aggregation
 """
 
+import functools
 from datetime import datetime
-from typing import Optional, List, Dict
+from typing import Any, Optional, List, Dict
 from pydantic import BaseModel, Field, field_validator
 import pandas as pd
 
 
+# Non-essay columns of Silver/Gold DataFrames; every other column holds an essay value
+METADATA_COLUMNS = frozenset({
+    # Silver layer (identifiers, machine/component/oil metadata, history)
+    'client', 'sampleNumber', 'sampleDate', 'unitId', 'machineName',
+    'machineModel', 'machineBrand', 'machineHours', 'machineSerialNumber',
+    'componentName', 'componentNameNormalized', 'componentHours', 'componentSerialNumber',
+    'oilMeter', 'oilBrand', 'oilType', 'oilWeight',
+    'previousSampleNumber', 'previousSampleDate', 'daysSincePrevious',
+    'group_element',
+    # Gold layer (classification and AI outputs)
+    'essays_broken', 'severity_score', 'report_status',
+    'breached_essays', 'ai_recommendation', 'ai_generated_at'
+})
+
+
+@functools.lru_cache(maxsize=8)
+def _essay_columns(columns: tuple) -> tuple:
+    """Essay columns of a column tuple (memoized per distinct column layout)."""
+    return tuple(col for col in columns if col not in METADATA_COLUMNS)
+
+
+def get_essay_columns(df: pd.DataFrame) -> List[str]:
+    """
+    Detect essay columns of a Silver/Gold DataFrame (every non-metadata column).
+    
+    Args:
+        df: DataFrame with oil samples
+    
+    Returns:
+        List of essay column names, in DataFrame column order
+    """
+    return list(_essay_columns(tuple(df.columns)))
+
+
 class OilSample(BaseModel):
     """
     Schema for harmonized oil sample (Silver layer).
@@ -83,7 +118,7 @@ class ClassifiedReport(BaseModel):
     essays_broken: int = Field(..., description="Number of essays exceeding thresholds")
     severity_score: int = Field(..., description="Total severity points (1=Marginal, 3=Condenatorio, 5=Critico)")
     report_status: str = Field(..., description="Classification: Normal, Alerta, or Anormal")
-    breached_essays: List[Dict[str, any]] = Field(default_factory=list, description="List of essays that exceeded thresholds")
+    breached_essays: List[Dict[str, Any]] = Field(default_factory=list, description="List of essays that exceeded thresholds")
     
     # AI recommendation
     ai_recommendation: Optional[str] = Field(None, description="AI-generated maintenance recommendation")
@@ -132,7 +167,7 @@ class MachineStatus(BaseModel):
     priority_score: int = Field(..., description="Priority score for maintenance (higher = more urgent)")
     
     # Component details
-    component_details: List[Dict[str, any]] = Field(default_factory=list, description="Status of each component")
+    component_details: List[Dict[str, Any]] = Field(default_factory=list, description="Status of each component")
     
     model_config = {
         "json_schema_extra": {
@@ -166,11 +201,12 @@ def dataframe_to_oil_samples(df: pd.DataFrame) -> List[OilSample]:
     Returns:
         List of validated OilSample instances
     """
-    samples = []
-    for _, row in df.iterrows():
-        sample = OilSample(**row.to_dict())
-        samples.append(sample)
-    return samples
+    # itertuples + zip avoids the per-row Series (and dtype upcasting) of iterrows
+    columns = df.columns.tolist()
+    return [
+        OilSample(**dict(zip(columns, row)))
+        for row in df.itertuples(index=False, name=None)
+    ]
 
 
 def oil_samples_to_dataframe(samples: List[OilSample]) -> pd.DataFrame:
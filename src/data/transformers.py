@@ -13,6 +13,15 @@ from src.processing.name_normalization import normalize_dataframe_names
 
 logger = get_logger(__name__)
 
+# Harmonized (Silver) metadata columns kept by every lab transformer, in output order;
+# essay columns from the essays mapping follow them
+HARMONIZED_COLUMNS = (
+    'client', 'sampleNumber', 'sampleDate',
+    'unitId', 'machineName', 'machineModel', 'machineBrand', 'machineHours', 'machineSerialNumber',
+    'componentName', 'componentHours', 'componentSerialNumber',
+    'oilMeter', 'oilBrand', 'oilType', 'oilWeight'
+)
+
 
 def transform_cda_data(df: pd.DataFrame, essays_mapping_df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -72,16 +81,10 @@ def transform_cda_data(df: pd.DataFrame, essays_mapping_df: pd.DataFrame) -> pd.
     df['client'] = 'CDA'
     
     # Select valid columns
-    valid_columns = [
-        'client', 'sampleNumber', 'sampleDate',
-        'unitId', 'machineName', 'machineModel', 'machineBrand', 'machineHours', 'machineSerialNumber',
-        'componentName', 'componentHours', 'componentSerialNumber',
-        'oilMeter', 'oilBrand', 'oilType', 'oilWeight'
-    ] + list(essays_mapping_df['ElementNameSpanish'])
+    valid_columns = [*HARMONIZED_COLUMNS, *essays_mapping_df['ElementNameSpanish']]
     
-    # Filter to valid columns that exist
-    valid_columns = [col for col in valid_columns if col in df.columns]
-    df = df[valid_columns].copy()
+    # Filter to valid columns that exist (filter keeps the given order and returns a new frame)
+    df = df.filter(items=valid_columns)
     
     logger.info(f"Transformed CDA data: {len(df)} rows, {len(df.columns)} columns")
     return df
@@ -164,10 +167,8 @@ def transform_emin_data(df: pd.DataFrame, essays_mapping_df: pd.DataFrame) -> pd
     
     df_melted = df_melted.drop(columns=['test_number'])
     df_melted = df_melted.dropna()
-    df_melted = df_melted.sort_values(by=['sampleNumber', 'testName'])
-    df_melted = df_melted.reset_index(drop=True)
     
-    # Pivot to create essay columns
+    # Pivot to create essay columns (pivot orders index/columns itself, no pre-sort needed)
     df_pivoted = df_melted.pivot(index='sampleNumber', columns='testName', values='testValue')
     
     # Merge back to main dataframe
@@ -184,16 +185,10 @@ def transform_emin_data(df: pd.DataFrame, essays_mapping_df: pd.DataFrame) -> pd
     df['client'] = 'EMIN'
     
     # Select valid columns
-    valid_columns = [
-        'client', 'sampleNumber', 'sampleDate',
-        'unitId', 'machineName', 'machineModel', 'machineBrand', 'machineHours', 'machineSerialNumber',
-        'componentName', 'componentHours', 'componentSerialNumber',
-        'oilMeter', 'oilBrand', 'oilType', 'oilWeight'
-    ] + list(essays_mapping_df['ElementNameSpanish'])
-    
-    # Filter to valid columns that exist
-    valid_columns = [col for col in valid_columns if col in df.columns]
-    df = df[valid_columns].copy()
+    valid_columns = [*HARMONIZED_COLUMNS, *essays_mapping_df['ElementNameSpanish']]
+    
+    # Filter to valid columns that exist (filter keeps the given order and returns a new frame)
+    df = df.filter(items=valid_columns)
     
     logger.info(f"Transformed EMIN data: {len(df)} rows, {len(df.columns)} columns")
     return df
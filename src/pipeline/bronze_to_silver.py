@@ -12,7 +12,7 @@ from src.utils.logger import get_logger
 from src.data.loaders import load_cda_data, load_emin_data, load_essays_mapping
 from src.data.transformers import apply_full_transformation
 from src.data.validators import filter_invalid_samples, validate_date_range, validate_numeric_essays
-from src.data.exporters import export_to_parquet
+from src.data.exporters import CATEGORICAL_KEY_COLUMNS, export_to_parquet, to_categorical
 
 logger = get_logger(__name__)
 
@@ -100,6 +100,9 @@ def run_bronze_to_silver_pipeline(
         output_file = settings.get_silver_path(client_upper)
     
     logger.info(f"Step 5: Exporting to Silver layer: {output_file}")
+    # Key columns become categoricals in memory: downstream groupby/filters work on
+    # integer codes (the Silver file itself keeps them as strings)
+    df = to_categorical(df, CATEGORICAL_KEY_COLUMNS)
     export_to_parquet(df, output_file)
     
     logger.info(f"===== Bronze → Silver pipeline complete for {client_upper} =====")
@@ -9,7 +9,7 @@ from typing import List, Dict
 from openai import OpenAI
 from dotenv import load_dotenv
 from config.settings import get_settings
-from config.logging_config import setup_logging
+from config.logging_config import ensure_logging
 from src.utils.logger import get_logger
 from src.pipeline.bronze_to_silver import run_bronze_to_silver_pipeline
 from src.pipeline.silver_to_gold import run_silver_to_gold_pipeline
@@ -48,8 +48,8 @@ def run_full_pipeline(
     Returns:
         Dictionary with results for each client
     """
-    # Setup logging
-    logger = setup_logging(log_file="full_pipeline.log", level="INFO")
+    # Setup logging (keeps the caller's configuration if one is already active)
+    logger = ensure_logging(log_file="full_pipeline.log", level="INFO")
     logger.info("=" * 80)
     logger.info("STARTING FULL PIPELINE EXECUTION")
     logger.info("=" * 80)
@@ -106,14 +106,15 @@ def run_full_pipeline(
                 results[client] = {'error': 'No data in Silver layer'}
                 continue
             
-            # Silver → Gold
+            # Silver → Gold (reuses the Silver DataFrame instead of re-reading the file)
             logger.info(f"[{client}] Phase 2/2: Silver → Gold")
             gold_results = run_silver_to_gold_pipeline(
                 client=client,
                 openai_client=openai_client,
                 recalculate_limits=recalculate_limits,
                 generate_ai=generate_ai,
-                max_workers=max_workers
+                max_workers=max_workers,
+                silver_df=silver_df
             )
             
             # Store results
@@ -11,11 +11,15 @@ from openai import OpenAI
 from config.settings import get_settings
 from src.utils.logger import get_logger
 from src.utils.file_utils import safe_read_parquet
+from src.data.schemas import get_essay_columns
 from src.data.loaders import load_stewart_limits
-from src.data.exporters import export_classified_reports, export_machine_status
+from src.data.exporters import (
+    CATEGORICAL_KEY_COLUMNS, to_categorical,
+    export_classified_reports, export_latest_samples, export_machine_status, export_stewart_limits_parquet
+)
 from src.processing.stewart_limits import calculate_all_limits, save_limits_to_json, save_limits_to_parquet
 from src.processing.classification import classify_all_samples
-from src.processing.aggregations import get_machine_status
+from src.processing.aggregations import get_latest_samples, get_machine_status
 from src.ai.parallel_executor import generate_all_recommendations
 
 logger = get_logger(__name__)
@@ -28,7 +32,8 @@ def run_silver_to_gold_pipeline(
     stewart_limits_file: Optional[str | Path] = None,
     recalculate_limits: bool = False,
     generate_ai: bool = True,
-    max_workers: int = 18
+    max_workers: int = 18,
+    silver_df: Optional[pd.DataFrame] = None
 ) -> Dict[str, pd.DataFrame]:
     """
     Run Silver → Gold transformation pipeline for a client.
@@ -49,6 +54,8 @@ def run_silver_to_gold_pipeline(
         recalculate_limits: If True, recalculate limits instead of loading
         generate_ai: If True, generate AI recommendations (requires API key)
         max_workers: Number of parallel workers for AI generation
+        silver_df: Silver layer DataFrame already in memory (e.g. just produced by
+            run_bronze_to_silver_pipeline); if given, input_file is not read
     
     Returns:
         Dictionary with 'classified', 'machines' DataFrames
@@ -59,28 +66,28 @@ def run_silver_to_gold_pipeline(
     logger.info(f"===== Starting Silver → Gold pipeline for {client_upper} =====")
     
     # Step 1: Load Silver layer data
-    if input_file is None:
-        input_file = settings.get_silver_path(client_upper)
-    
-    logger.info(f"Step 1: Loading Silver layer data from {input_file}")
-    df = safe_read_parquet(input_file)
+    # CRITICAL: Only this client's rows are used, to prevent data leakage between clients
+    if silver_df is not None:
+        logger.info("Step 1: Using Silver layer data already in memory")
+        df = silver_df[silver_df['client'] == client_upper]
+    else:
+        if input_file is None:
+            input_file = settings.get_silver_path(client_upper)
+        
+        logger.info(f"Step 1: Loading Silver layer data from {input_file}")
+        # (the client filter is pushed down to the Parquet reader instead of applied after loading)
+        df = safe_read_parquet(input_file, filters=[('client', '==', client_upper)])
+        # Same in-memory key dtypes as Silver data handed over by bronze_to_silver
+        df = to_categorical(df, CATEGORICAL_KEY_COLUMNS)
     
     if df.empty:
-        logger.error(f"No data loaded from {input_file}")
+        logger.error(f"No Silver layer data for {client_upper}")
         return {'classified': df, 'machines': pd.DataFrame()}
     
     logger.info(f"Loaded {len(df)} samples from Silver layer")
     
     # Detect essay columns
-    metadata_cols = {
-        'client', 'sampleNumber', 'sampleDate', 'unitId', 'machineName', 
-        'machineModel', 'machineBrand', 'machineHours', 'machineSerialNumber',
-        'componentName', 'componentHours', 'componentSerialNumber',
-        'oilMeter', 'oilBrand', 'oilType', 'oilWeight',
-        'previousSampleNumber', 'previousSampleDate', 'daysSincePrevious',
-        'group_element'
-    }
-    essays_list = [col for col in df.columns if col not in metadata_cols]
+    essays_list = get_essay_columns(df)
     logger.info(f"Detected {len(essays_list)} essay columns")
     
     # Step 2: Calculate or load Stewart Limits
@@ -90,13 +97,9 @@ def run_silver_to_gold_pipeline(
     if recalculate_limits:
         logger.info("Step 2: Calculating Stewart Limits")
         
-        # CRITICAL: Filter data to only this client to prevent data leakage
-        client_df = df[df['client'] == client_upper].copy()
-        logger.info(f"Filtering to client {client_upper}: {len(client_df)} samples (from {len(df)} total)")
-        
-        # Calculate limits for this client ONLY
+        # Calculate limits for this client ONLY (df was filtered to the client at load time)
         client_limits = calculate_all_limits(
-            df=client_df,
+            df=df,
             client=client_upper,
             essay_columns=essays_list,
             percentiles=(
@@ -140,7 +143,8 @@ def run_silver_to_gold_pipeline(
     
     # Step 5: Aggregate machine statuses
     logger.info("Step 5: Aggregating machine statuses")
-    machine_df = get_machine_status(df)
+    latest_samples_df = get_latest_samples(df)
+    machine_df = get_machine_status(df, latest_samples=latest_samples_df)
     
     # Step 6: Export to Golden layer
     logger.info(f"Step 6: Exporting to Golden layer")
@@ -149,14 +153,17 @@ def run_silver_to_gold_pipeline(
     classified_reports_path = settings.get_classified_reports_path(client_upper)
     export_classified_reports(df, classified_reports_path, client_upper)
     
+    # Export latest sample per unit/component so consumers don't recompute it
+    latest_samples_path = settings.get_latest_samples_path(client_upper)
+    export_latest_samples(latest_samples_df, latest_samples_path)
+    
     # Export machine status to Golden layer
     machine_status_path = settings.get_machine_status_path(client_upper)
     export_machine_status(machine_df, machine_status_path)
     
-    # Export Stewart Limits to Golden layer (per client)
-    if recalculate_limits:
-        stewart_limits_path = settings.get_stewart_limits_path(client_upper)
-        from src.data.exporters import export_stewart_limits_parquet
+    # Export Stewart Limits to Golden layer (per client), unless Step 2 already wrote that file
+    stewart_limits_path = settings.get_stewart_limits_path(client_upper)
+    if recalculate_limits and Path(stewart_limits_file) != stewart_limits_path:
         export_stewart_limits_parquet(limits, stewart_limits_path)
     
     logger.info(f"===== Silver → Gold pipeline complete for {client_upper} =====")
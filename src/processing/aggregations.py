@@ -5,19 +5,67 @@ Create machine-level and component-level summaries from classified reports.
 """
 
 import pandas as pd
-from typing import List
+from typing import List, Optional
 from src.utils.logger import get_logger
 from src.processing.classification import classify_machine
 
 logger = get_logger(__name__)
 
 
+def get_latest_samples(
+    df: pd.DataFrame,
+    date_col: str = 'sampleDate',
+    unit_col: str = 'unitId',
+    component_col: str = 'componentName'
+) -> pd.DataFrame:
+    """
+    Keep only the latest sample for each unit/component combination.
+    
+    Uses a sort + duplicated pass over the key columns instead of
+    groupby().idxmax(), which is considerably slower on large tables. The sort
+    is skipped when the rows are already in (unit, component, date) order.
+    Missing dates are never picked over a present one, and among samples tied
+    on the latest date the first row wins, as with idxmax.
+    
+    Args:
+        df: DataFrame with classified reports
+        date_col: Date column name
+        unit_col: Machine unit ID column
+        component_col: Component name column
+    
+    Returns:
+        DataFrame with one row per (unit, component), ordered by unit and component
+    """
+    # Sort/deduplicate a narrow projection of the key columns, then gather the full rows
+    sort_cols = [unit_col, component_col, date_col]
+    keys = df[sort_cols].reset_index(drop=True)
+    # Missing dates sort first so they are never taken as the latest sample (as idxmax skips
+    # them); the already-ordered fast path only applies when every date is present
+    already_sorted = (
+        keys[date_col].notna().all()
+        and pd.MultiIndex.from_frame(keys).is_monotonic_increasing
+    )
+    if not already_sorted:
+        # (Silver data is already ordered by unit/component/date, so this is usually skipped)
+        keys = keys.sort_values(sort_cols, kind='stable', na_position='first')
+    # Among samples tied on the latest date keep the first one, as idxmax does: reduce each
+    # (unit, component, date) run to its first row, then take the last run of each pair
+    keys = keys[~keys.duplicated(subset=sort_cols, keep='first').to_numpy()]
+    is_latest = ~keys.duplicated(subset=[unit_col, component_col], keep='last')
+    latest = df.iloc[keys.index[is_latest.to_numpy()]]
+    
+    logger.info(f"Selected {len(latest)} latest samples from {len(df)} reports")
+    
+    return latest.reset_index(drop=True)
+
+
 def get_machine_status(
     df: pd.DataFrame,
     date_col: str = 'sampleDate',
     unit_col: str = 'unitId',
     component_col: str = 'componentName',  # Use original componentName for granular grouping
-    status_col: str = 'report_status'
+    status_col: str = 'report_status',
+    latest_samples: Optional[pd.DataFrame] = None
 ) -> pd.DataFrame:
     """
     Aggregate component statuses to machine-level health status.
@@ -31,19 +79,27 @@ def get_machine_status(
         unit_col: Machine unit ID column
         component_col: Component name column
         status_col: Report status column
+        latest_samples: Output of get_latest_samples(df), if already computed
     
     Returns:
         DataFrame with machine-level statuses
     """
     logger.info(f"Aggregating machine statuses from {len(df)} reports")
     
-    # Get unique units
-    units = df[unit_col].unique()
+    # Machine status only depends on the latest sample of each component, so compute
+    # those once and split them per unit instead of rescanning df for every unit
+    if latest_samples is None:
+        latest_samples = get_latest_samples(df, date_col, unit_col, component_col)
+    unit_groups = dict(tuple(latest_samples.groupby(unit_col, sort=False, observed=True)))
     
     machine_statuses = []
     
-    for unit in units:
-        machine_dict = classify_machine(df, unit)
+    for unit in df[unit_col].unique():
+        unit_df = unit_groups.get(unit)
+        if unit_df is None:
+            continue
+        
+        machine_dict = classify_machine(unit_df, unit)
         if machine_dict:
             machine_statuses.append(machine_dict)
     
@@ -70,10 +126,11 @@ def create_component_summary(
     """
     logger.info("Creating component summary")
     
-    summary = df.groupby(group_cols).agg({
+    # observed=True: only existing combinations when key columns are categorical
+    grouped = df.groupby(group_cols, observed=True)
+    summary = grouped.agg({
         'sampleNumber': 'count',
         'sampleDate': ['min', 'max'],
-        'report_status': lambda x: x.value_counts().to_dict(),
         'severity_score': ['mean', 'max'],
         'essays_broken': ['mean', 'max']
     }).reset_index()
@@ -81,12 +138,24 @@ def create_component_summary(
     # Flatten multi-level columns
     summary.columns = ['_'.join(col).strip('_') for col in summary.columns.values]
     
+    # Status distribution per group from a single value_counts pass
+    # (instead of a Python lambda building a Series per group)
+    status_counts = grouped['report_status'].value_counts()
+    status_distribution = {}
+    for (*key, status), count in status_counts.items():
+        status_distribution.setdefault(tuple(key), {})[status] = int(count)
+    
+    summary.insert(
+        len(group_cols) + 3,
+        'status_distribution',
+        [status_distribution.get(key, {}) for key in zip(*(summary[col] for col in group_cols))]
+    )
+    
     # Rename for clarity
     summary = summary.rename(columns={
         'sampleNumber_count': 'total_samples',
         'sampleDate_min': 'first_sample_date',
         'sampleDate_max': 'latest_sample_date',
-        'report_status_<lambda>': 'status_distribution',
         'severity_score_mean': 'avg_severity_score',
         'severity_score_max': 'max_severity_score',
         'essays_broken_mean': 'avg_essays_broken',
@@ -114,8 +183,12 @@ def create_priority_table(
     """
     logger.info(f"Creating priority table (top {top_n})")
     
-    # Filter to machines with issues
-    priority_df = machine_df[machine_df['overall_status'] != 'Normal'].copy()
+    # Filter to machines with issues (the boolean mask already returns a new frame)
+    priority_df = machine_df[machine_df['overall_status'].to_numpy() != 'Normal']
+    
+    # Keep the top N priority scores (ties at the cutoff included) before the full sort,
+    # so only the candidate rows are sorted
+    priority_df = priority_df.nlargest(top_n, 'priority_score', keep='all')
     
     # Sort by priority score (descending) and latest date (descending)
     priority_df = priority_df.sort_values(
@@ -151,21 +224,20 @@ def create_time_series_data(
     Returns:
         DataFrame with time series (date, value)
     """
-    # Filter to unit and component
-    filtered = df[
-        (df['unitId'] == unit_id) &
-        (df['componentName'] == component)
-    ].copy()
-    
     # Check if essay exists
-    if essay not in filtered.columns:
+    if essay not in df.columns:
         logger.warning(f"Essay '{essay}' not found in data")
         return pd.DataFrame()
     
-    # Select relevant columns
-    time_series = filtered[[date_col, essay]].copy()
+    # Filter to unit and component, selecting only the relevant columns
+    # (.loc with a column list already returns a new frame, so no .copy() is needed)
+    mask = (df['unitId'] == unit_id) & (df['componentName'] == component)
+    time_series = df.loc[mask, [date_col, essay]]
     time_series = time_series.dropna(subset=[essay])
-    time_series = time_series.sort_values(date_col)
+    # Classified reports are stored in unit/component/date order, so a unit/component
+    # slice is normally chronological already and the sort can be skipped
+    if not time_series[date_col].is_monotonic_increasing:
+        time_series = time_series.sort_values(date_col)
     
     logger.info(f"Created time series for {unit_id}/{component}/{essay}: {len(time_series)} points")
     
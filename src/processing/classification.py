@@ -9,8 +9,9 @@ Three-tier classification system:
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple
+from typing import Dict, List, Mapping, Optional, Tuple
 from src.utils.logger import get_logger
+from src.processing.stewart_limits import flatten_limits, threshold_tuple
 
 logger = get_logger(__name__)
 
@@ -71,23 +72,111 @@ def identify_threshold(
         return None, None
 
 
-def classify_essays(
-    sample: pd.Series,
-    limits: Dict,
+def _as_float_array(values) -> np.ndarray:
+    """Coerce measured essay values to a float array in one vector cast (NaN if missing or non-numeric)."""
+    numeric = pd.to_numeric(pd.Series(values, dtype=object), errors='coerce')
+    return numeric.to_numpy(dtype=float, na_value=np.nan)
+
+
+def _essay_values(df: pd.DataFrame, essays_list: List[str]) -> np.ndarray:
+    """Measured essay values as a (samples x essays) float matrix (NaN if missing or non-numeric)."""
+    values = np.full((len(df), len(essays_list)), np.nan)
+    
+    for j, essay in enumerate(essays_list):
+        if essay not in df.columns:
+            continue
+        column = df[essay]
+        if pd.api.types.is_numeric_dtype(column):
+            values[:, j] = column.to_numpy(dtype=float, na_value=np.nan)
+        else:
+            values[:, j] = _as_float_array(column.to_numpy())
+    
+    return values
+
+
+def _classify_value_matrix(
+    values: np.ndarray,
+    thresholds: np.ndarray,
     essays_list: List[str],
     points_dict: Dict[str, int] = ESSAY_POINTS
-) -> Tuple[pd.DataFrame, int]:
+) -> Tuple[np.ndarray, np.ndarray, List[List[Dict]]]:
     """
-    Classify all essays for a single sample.
+    Classify a (samples x essays) value matrix against one machine/component's limits.
+    
+    An essay is breached when its value reaches the marginal threshold (NaN values
+    or thresholds never breach); the highest threshold reached follows the same
+    precedence as identify_threshold.
+    
+    Args:
+        values: Float matrix of measured values, columns ordered as essays_list
+        thresholds: (essays x 3) float matrix of (normal, alert, critic) thresholds
+        essays_list: Essay names of the matrix columns
+        points_dict: Points mapping for thresholds
+    
+    Returns:
+        Tuple of (essays broken per sample, severity score per sample,
+        breached essay records per sample)
+    """
+    n_samples = values.shape[0]
+    
+    marginal, condenatorio, critico = thresholds[:, 0], thresholds[:, 1], thresholds[:, 2]
+    
+    # Breached cells in row-major order (per sample, essays in essays_list order)
+    rows, cols = np.nonzero(values >= marginal)
+    breached_values = values[rows, cols]
+    at_critico = breached_values >= critico[cols]
+    at_condenatorio = breached_values >= condenatorio[cols]
+    
+    thresholds = np.select([at_critico, at_condenatorio], ['Critico', 'Condenatorio'], default='Marginal')
+    value_lims = np.select([at_critico, at_condenatorio], [critico[cols], condenatorio[cols]], default=marginal[cols])
+    points = np.select(
+        [at_critico, at_condenatorio],
+        [points_dict.get('Critico', 0), points_dict.get('Condenatorio', 0)],
+        default=points_dict.get('Marginal', 0)
+    )
+    
+    essays_broken = np.bincount(rows, minlength=n_samples)
+    severity_scores = np.bincount(rows, weights=points, minlength=n_samples).astype(int)
+    
+    breached_records = [[] for _ in range(n_samples)]
+    for row, col, value, threshold, limit, essay_points in zip(
+        rows.tolist(), cols.tolist(), breached_values.tolist(),
+        thresholds.tolist(), value_lims.tolist(), points.tolist()
+    ):
+        breached_records[row].append({
+            'essay': essays_list[col],
+            'value': value,
+            'threshold': threshold,
+            'limit': limit,
+            'points': essay_points
+        })
+    
+    return essays_broken, severity_scores, breached_records
+
+
+def classify_essays_records(
+    sample: pd.Series | Mapping,
+    limits: Dict,
+    essays_list: List[str],
+    points_dict: Dict[str, int] = ESSAY_POINTS,
+    threshold_cache: Optional[Dict] = None
+) -> Tuple[List[Dict], int]:
+    """
+    Classify all essays for a single sample, returning breached essays as records.
+    
+    Same as classify_essays without building a DataFrame, for callers that only
+    need the list of dicts (e.g. the breached_essays column).
     
     Args:
-        sample: Series with sample data (must include client, machineName, componentName, essay values)
+        sample: Series or dict with sample data (must include client, machineName, componentName, essay values)
         limits: Stewart Limits dictionary
         essays_list: List of essay column names to check
         points_dict: Points mapping for thresholds
+        threshold_cache: Optional dict shared across calls with the same limits and
+            essays_list; memoizes the threshold matrix per (client, machine, component)
     
     Returns:
-        Tuple of (essays_broken DataFrame, total_severity_points)
+        Tuple of (breached essay records, total_severity_points)
     """
     client = sample.get('client', '')
     machine = sample.get('machineName', '')
@@ -95,46 +184,49 @@ def classify_essays(
     component_normalized = sample.get('componentNameNormalized', sample.get('componentName', ''))
     
     # Get limits for this machine/component (using normalized component name)
-    sel_limits = limits.get(client, {}).get(machine, {}).get(component_normalized, {})
+    cache_key = (client, machine, component_normalized)
+    thresholds = threshold_cache.get(cache_key) if threshold_cache is not None else None
+    if thresholds is None:
+        sel_limits = limits.get(client, {}).get(machine, {}).get(component_normalized, {})
+        thresholds = np.array(
+            [threshold_tuple(sel_limits.get(essay, {})) for essay in essays_list], dtype=float
+        ).reshape(-1, 3)
+        if threshold_cache is not None:
+            threshold_cache[cache_key] = thresholds
     
-    essays_broken = []
+    # Classify the sample as a one-row value matrix
+    values = _as_float_array([sample.get(essay, np.nan) for essay in essays_list]).reshape(1, -1)
+    _, severity_scores, breached_records = _classify_value_matrix(values, thresholds, essays_list, points_dict)
     
-    for essay in essays_list:
-        # Get thresholds for this essay
-        marginal = sel_limits.get(essay, {}).get('threshold_normal', np.nan)
-        condenatorio = sel_limits.get(essay, {}).get('threshold_alert', np.nan)
-        critico = sel_limits.get(essay, {}).get('threshold_critic', np.nan)
-        
-        # Get measured value and ensure it's numeric
-        value = sample.get(essay, np.nan)
-        try:
-            value = float(value) if not pd.isna(value) else np.nan
-        except (ValueError, TypeError):
-            # Skip non-numeric values
-            continue
-        
-        # Skip if value is invalid or below marginal threshold
-        if pd.isna(value) or pd.isna(marginal) or value < marginal:
-            continue
-        
-        # Identify threshold
-        threshold_reached, value_lim = identify_threshold(value, marginal, condenatorio, critico)
-        
-        if threshold_reached:
-            essays_broken.append({
-                'essay': essay,
-                'value': value,
-                'threshold': threshold_reached,
-                'limit': value_lim,
-                'points': points_dict.get(threshold_reached, 0)
-            })
+    return breached_records[0], int(severity_scores[0])
+
+
+def classify_essays(
+    sample: pd.Series | Mapping,
+    limits: Dict,
+    essays_list: List[str],
+    points_dict: Dict[str, int] = ESSAY_POINTS,
+    threshold_cache: Optional[Dict] = None
+) -> Tuple[pd.DataFrame, int]:
+    """
+    Classify all essays for a single sample.
     
-    essays_broken_df = pd.DataFrame(essays_broken)
+    Args:
+        sample: Series or dict with sample data (must include client, machineName, componentName, essay values)
+        limits: Stewart Limits dictionary
+        essays_list: List of essay column names to check
+        points_dict: Points mapping for thresholds
+        threshold_cache: Optional dict shared across calls with the same limits and
+            essays_list; memoizes the threshold matrix per (client, machine, component)
     
-    # Calculate total severity score
-    severity_score = essays_broken_df['points'].sum() if not essays_broken_df.empty else 0
+    Returns:
+        Tuple of (essays_broken DataFrame, total_severity_points)
+    """
+    breached_records, severity_score = classify_essays_records(
+        sample, limits, essays_list, points_dict, threshold_cache
+    )
     
-    return essays_broken_df, int(severity_score)
+    return pd.DataFrame(breached_records), severity_score
 
 
 def classify_report(
@@ -184,8 +276,8 @@ def classify_machine(
     Returns:
         Dictionary with machine status details
     """
-    # Filter to this machine's latest samples
-    machine_df = df[df['unitId'] == unit_id].copy()
+    # Filter to this machine's samples (only read below, so no copy)
+    machine_df = df[df['unitId'] == unit_id]
     
     if machine_df.empty:
         logger.warning(f"No data found for unit {unit_id}")
@@ -195,7 +287,13 @@ def classify_machine(
     latest_date = machine_df['sampleDate'].max()
     
     # Get latest samples for each component
-    latest_samples = machine_df.loc[machine_df.groupby('componentName')['sampleDate'].idxmax()]
+    # (sort + drop_duplicates avoids the groupby idxmax → loc double pass; as with idxmax,
+    # missing dates are skipped and the first of the samples tied on the latest date wins)
+    latest_samples = machine_df.sort_values(
+        ['componentName', 'sampleDate'], na_position='first', kind='stable'
+    ).drop_duplicates(
+        subset=['componentName', 'sampleDate'], keep='first'
+    ).drop_duplicates(subset='componentName', keep='last')
     
     # Count status distribution
     status_counts = latest_samples['report_status'].value_counts().to_dict()
@@ -218,14 +316,26 @@ def classify_machine(
         priority_score = 5
     
     # Create component details
-    component_details = []
-    for _, row in latest_samples.iterrows():
-        component_details.append({
-            'component': row['componentName'],
-            'status': row['report_status'],
-            'severity_score': row.get('severity_score', 0),
-            'sample_date': row['sampleDate'].isoformat() if pd.notna(row['sampleDate']) else None
-        })
+    # (column-wise zip instead of iterrows, which builds a Series per row)
+    if 'severity_score' in latest_samples.columns:
+        severity_scores = latest_samples['severity_score'].tolist()
+    else:
+        severity_scores = [0] * len(latest_samples)
+    
+    component_details = [
+        {
+            'component': component,
+            'status': status,
+            'severity_score': severity_score,
+            'sample_date': sample_date.isoformat() if pd.notna(sample_date) else None
+        }
+        for component, status, severity_score, sample_date in zip(
+            latest_samples['componentName'].tolist(),
+            latest_samples['report_status'].tolist(),
+            severity_scores,
+            latest_samples['sampleDate'].tolist()
+        )
+    ]
     
     return {
         'unit_id': unit_id,
@@ -262,20 +372,51 @@ def classify_all_samples(
     
     df = df.copy()
     
-    # Initialize classification columns
-    df['essays_broken'] = 0
-    df['severity_score'] = 0
-    df['report_status'] = 'Normal'
-    df['breached_essays'] = [[] for _ in range(len(df))]
+    essays_broken = np.zeros(len(df), dtype=int)
+    severity_scores = np.zeros(len(df), dtype=int)
+    breached_essays = [[] for _ in range(len(df))]
+    
+    # Samples of the same client/machine/component share one set of limits, so each
+    # group is classified with array operations on its (samples x essays) value matrix.
+    # Normalized component name is used for the limit lookup, as in classify_essays.
+    component_col = 'componentNameNormalized' if 'componentNameNormalized' in df.columns else 'componentName'
+    group_keys = [
+        df[col] if col in df.columns else pd.Series('', index=df.index)
+        for col in ('client', 'machineName', component_col)
+    ]
+    groups = df.groupby(group_keys, sort=False, dropna=False, observed=True).indices
     
-    # Classify each sample
-    for idx, row in df.iterrows():
-        essays_broken_df, severity_score = classify_essays(row, limits, essays_list)
+    # One tuple-keyed lookup per essay instead of the nested client/machine/component chain
+    flat_limits = flatten_limits(limits)
+    no_limits = (np.nan, np.nan, np.nan)
+    
+    for (client, machine, component), positions in groups.items():
+        thresholds = np.array(
+            [flat_limits.get((client, machine, component, essay), no_limits) for essay in essays_list],
+            dtype=float
+        ).reshape(-1, 3)
+        if np.isnan(thresholds[:, 0]).all():
+            # No limits for this machine/component: nothing can be breached
+            continue
         
-        df.at[idx, 'essays_broken'] = len(essays_broken_df)
-        df.at[idx, 'severity_score'] = severity_score
-        df.at[idx, 'report_status'] = classify_report(len(essays_broken_df), severity_score)
-        df.at[idx, 'breached_essays'] = essays_broken_df.to_dict('records') if not essays_broken_df.empty else []
+        group_broken, group_scores, group_records = _classify_value_matrix(
+            _essay_values(df.iloc[positions], essays_list), thresholds, essays_list
+        )
+        essays_broken[positions] = group_broken
+        severity_scores[positions] = group_scores
+        for position, records in zip(positions, group_records):
+            breached_essays[position] = records
+    
+    # Add classification columns
+    df['essays_broken'] = essays_broken
+    df['severity_score'] = severity_scores
+    # Same rule as classify_report, applied to the whole score array at once
+    df['report_status'] = np.select(
+        [severity_scores < REPORT_THRESHOLDS['Normal'], severity_scores >= REPORT_THRESHOLDS['Anormal']],
+        ['Normal', 'Anormal'],
+        default='Alerta'
+    ).astype(object)
+    df['breached_essays'] = breached_essays
     
     logger.info(f"Classification complete: {df['report_status'].value_counts().to_dict()}")
     
@@ -9,6 +9,38 @@ import unicodedata
 from typing import Dict
 
 
+# Substring → common name mappings per column, used by reduce_cardinality_names
+CARDINALITY_MAPPINGS: Dict[str, Dict[str, str]] = {
+    'machineName': {
+        'bulldozer': 'bulldozer',
+        'pala': 'pala',
+    },
+    'componentName': {
+        'mando final': 'mando final',
+        'hidraulico': 'hidraulico',
+        'refrig': 'refrigerante',
+        'aceite': 'aceite',
+        'vibrador': 'vibrador',
+        'cojinete ': 'cojinete',
+        'winche': 'winche',
+        'trasmision': 'transmision',
+        'transmision': 'transmision',
+        'tandem': 'tandem',
+        'cubo': 'cubo',
+        'eje': 'eje',
+        'engranaje': 'engranaje',
+        'freno': 'freno',
+        'retardador': 'retardador',
+        'rueda': 'rueda',
+        'direccion': 'direccion',
+        'diferencial': 'diferencial',
+    },
+    'machineBrand': {
+        'cat': 'caterpillar',
+    }
+}
+
+
 def name_protocol(series: pd.Series) -> pd.Series:
     """
     Standardize names by normalizing unicode characters and converting to lowercase.
@@ -37,7 +69,7 @@ def reduce_cardinality_names(series: pd.Series) -> pd.Series:
     """
     Reduce cardinality of names by mapping similar names to common names.
     
-    Uses predefined mapping dictionaries for machineName, componentName, and machineBrand.
+    Uses the CARDINALITY_MAPPINGS dictionaries for machineName, componentName, and machineBrand.
     
     Args:
         series: Pandas Series with names to reduce
@@ -45,42 +77,11 @@ def reduce_cardinality_names(series: pd.Series) -> pd.Series:
     Returns:
         Series with reduced cardinality
     """
-    mapping: Dict[str, Dict[str, str]] = {
-        'machineName': {
-            'bulldozer': 'bulldozer',
-            'pala': 'pala',
-        },
-        'componentName': {
-            'mando final': 'mando final',
-            'hidraulico': 'hidraulico',
-            'refrig': 'refrigerante',
-            'aceite': 'aceite',
-            'vibrador': 'vibrador',
-            'cojinete ': 'cojinete',
-            'winche': 'winche',
-            'trasmision': 'transmision',
-            'transmision': 'transmision',
-            'tandem': 'tandem',
-            'cubo': 'cubo',
-            'eje': 'eje',
-            'engranaje': 'engranaje',
-            'freno': 'freno',
-            'retardador': 'retardador',
-            'rueda': 'rueda',
-            'direccion': 'direccion',
-            'diferencial': 'diferencial',
-        },
-        'machineBrand': {
-            'cat': 'caterpillar',
-        }
-    }
-    
     # Get the mapping for this series based on its name
-    if series.name not in mapping:
+    series_mapping = CARDINALITY_MAPPINGS.get(series.name)
+    if series_mapping is None:
         return series
     
-    series_mapping = mapping[series.name]
-    
     # Create a copy to avoid SettingWithCopyWarning
     result = series.copy()
     
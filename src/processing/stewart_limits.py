@@ -11,6 +11,8 @@ from pathlib import Path
 from typing import Dict, List, Tuple
 from src.utils.logger import get_logger
 from src.processing.name_normalization import name_protocol
+from src.data.exporters import export_stewart_limits_parquet
+from src.data.loaders import load_stewart_limits
 
 logger = get_logger(__name__)
 
@@ -45,10 +47,8 @@ def calculate_stewart_limits(
             'threshold_critic': np.nan
         }
     
-    # Calculate percentiles
-    normal = np.ceil(serie.quantile(percentiles[0] / 100))
-    alert = np.ceil(serie.quantile(percentiles[1] / 100))
-    critic = np.ceil(serie.quantile(percentiles[2] / 100))
+    # Calculate percentiles (one quantile call over the array instead of three scalar passes)
+    normal, alert, critic = np.ceil(serie.quantile([p / 100 for p in percentiles]).to_numpy())
     
     # Ensure thresholds are monotonically increasing
     if alert <= normal:
@@ -88,51 +88,80 @@ def calculate_all_limits(
     # Use pre-computed normalized columns from Silver layer
     # machineName is already normalized in Silver layer
     # componentNameNormalized is created specifically for Stewart Limits grouping
-    df = df.copy()
-    
     limits = {}
     
-    # Get unique machines (already normalized in Silver layer)
-    machines = df['machineName'].unique()
-    logger.info(f"Processing {len(machines)} normalized machines")
+    logger.info(f"Processing {df['machineName'].nunique()} normalized machines")
+    
+    # Single pass over machine/component combinations (using normalized names)
+    groups = df.groupby(['machineName', 'componentNameNormalized'], sort=False, observed=True)
     
-    for machine in machines:
-        limits[machine] = {}
+    for (machine, component), component_df in groups:
+        component_limits = limits.setdefault(machine, {}).setdefault(component, {})
         
-        # Get components for this machine (using normalized names)
-        machine_df = df[df['machineName'] == machine]
-        components = machine_df['componentNameNormalized'].unique()
+        # Drop columns with all NaNs
+        component_df = component_df.dropna(axis=1, how='all')
         
-        for component in components:
-            limits[machine][component] = {}
+        # Calculate limits for each essay
+        for essay in essay_columns:
+            if essay not in component_df.columns:
+                continue
             
-            # Filter data for this machine/component combination (using normalized names)
-            component_df = machine_df[machine_df['componentNameNormalized'] == component].copy()
+            # Check if essay has enough unique values
+            n_unique = component_df[essay].nunique()
+            if n_unique <= min_unique_values:
+                logger.debug(f"Skipping {essay} for {machine}/{component}: only {n_unique} unique values")
+                continue
             
-            # Drop columns with all NaNs
-            component_df = component_df.dropna(axis=1, how='all')
+            # Calculate limits
+            essay_limits = calculate_stewart_limits(component_df[essay], percentiles)
             
-            # Calculate limits for each essay
-            for essay in essay_columns:
-                if essay not in component_df.columns:
-                    continue
-                
-                # Check if essay has enough unique values
-                if component_df[essay].nunique() <= min_unique_values:
-                    logger.debug(f"Skipping {essay} for {machine}/{component}: only {component_df[essay].nunique()} unique values")
-                    continue
-                
-                # Calculate limits
-                essay_limits = calculate_stewart_limits(component_df[essay], percentiles)
-                
-                # Only store if valid (not all NaN)
-                if not pd.isna(essay_limits['threshold_normal']):
-                    limits[machine][component][essay] = essay_limits
+            # Only store if valid (not all NaN)
+            if not pd.isna(essay_limits['threshold_normal']):
+                component_limits[essay] = essay_limits
     
     logger.info(f"Stewart Limits calculation complete for {client}")
     return limits
 
 
+def threshold_tuple(essay_limits: Dict) -> Tuple[float, float, float]:
+    """
+    Get the three thresholds of one essay's limits (NaN where missing).
+    
+    Args:
+        essay_limits: Dictionary with threshold_normal, threshold_alert, threshold_critic
+    
+    Returns:
+        Tuple of (threshold_normal, threshold_alert, threshold_critic)
+    """
+    return (
+        essay_limits.get('threshold_normal', np.nan),
+        essay_limits.get('threshold_alert', np.nan),
+        essay_limits.get('threshold_critic', np.nan)
+    )
+
+
+def flatten_limits(limits: Dict) -> Dict[Tuple[str, str, str, str], Tuple[float, float, float]]:
+    """
+    Flatten nested Stewart Limits into a single tuple-keyed lookup.
+    
+    One hash lookup per essay replaces the client → machine → component → essay chain.
+    
+    Args:
+        limits: Stewart Limits dictionary {client: {machine: {component: {essay: {...}}}}}
+    
+    Returns:
+        Dictionary {(client, machine, component, essay): (threshold_normal, threshold_alert, threshold_critic)}
+    """
+    return {
+        (client, machine, component, essay): threshold_tuple(essay_limits)
+        for client, machines in limits.items()
+        for machine, components in machines.items()
+        for component, essays in components.items()
+        for essay, essay_limits in essays.items()
+        if isinstance(essay_limits, dict)
+    }
+
+
 def save_limits_to_json(limits: Dict, output_path: str | Path) -> None:
     """
     Save Stewart Limits to JSON file.
@@ -165,7 +194,6 @@ def save_limits_to_parquet(limits: Dict, output_path: str | Path) -> pd.DataFram
     Returns:
         Flattened DataFrame
     """
-    from src.data.exporters import export_stewart_limits_parquet
     return export_stewart_limits_parquet(limits, output_path)
 
 
@@ -179,5 +207,4 @@ def load_limits_from_json(file_path: str | Path) -> Dict:
     Returns:
         Limits dictionary
     """
-    from src.data.loaders import load_stewart_limits
     return load_stewart_limits(file_path)
@@ -4,9 +4,17 @@ File utility functions for Multi-Technical-Alerts.
 Provides helpers for file system operations.
 """
 
+import functools
 from pathlib import Path
-from typing import List
+from typing import Callable, List, Optional, Sequence, Tuple
 import pandas as pd
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# pyarrow reads the file through a memory map and decodes row groups on all cores
+# (use_threads defaults to True in pyarrow)
+PARQUET_READ_OPTIONS = {'engine': 'pyarrow', 'memory_map': True}
 
 
 def ensure_directory(path: Path) -> None:
@@ -82,6 +90,28 @@ def get_latest_file(directory: Path, pattern: str = "*") -> Path | None:
     return max(files, key=lambda p: p.stat().st_mtime)
 
 
+def _empty_on_error(reader: Callable[..., pd.DataFrame]) -> Callable[..., pd.DataFrame]:
+    """
+    Wrap a file reader so failures are logged and yield an empty DataFrame.
+    
+    Args:
+        reader: Function taking (file_path, **kwargs) and returning a DataFrame
+    
+    Returns:
+        Wrapped reader
+    """
+    @functools.wraps(reader)
+    def wrapper(file_path: Path, **kwargs) -> pd.DataFrame:
+        try:
+            return reader(file_path, **kwargs)
+        except Exception as e:
+            logger.error(f"Error reading {file_path}: {e}")
+            return pd.DataFrame()
+    
+    return wrapper
+
+
+@_empty_on_error
 def safe_read_excel(file_path: Path, **kwargs) -> pd.DataFrame:
     """
     Safely read Excel file with error handling.
@@ -93,26 +123,66 @@ def safe_read_excel(file_path: Path, **kwargs) -> pd.DataFrame:
     Returns:
         DataFrame or empty DataFrame if error
     """
-    try:
-        return pd.read_excel(file_path, **kwargs)
-    except Exception as e:
-        print(f"Error reading {file_path}: {e}")
-        return pd.DataFrame()
+    return pd.read_excel(file_path, **kwargs)
 
 
+@_empty_on_error
 def safe_read_parquet(file_path: Path, **kwargs) -> pd.DataFrame:
     """
     Safely read Parquet file with error handling.
     
     Args:
         file_path: Path to Parquet file
-        **kwargs: Additional arguments for pd.read_parquet
+        **kwargs: Additional arguments for pd.read_parquet (override PARQUET_READ_OPTIONS)
     
     Returns:
         DataFrame or empty DataFrame if error
     """
-    try:
-        return pd.read_parquet(file_path, **kwargs)
-    except Exception as e:
-        print(f"Error reading {file_path}: {e}")
-        return pd.DataFrame()
+    return pd.read_parquet(file_path, **{**PARQUET_READ_OPTIONS, **kwargs})
+
+
+@functools.lru_cache(maxsize=8)
+def _read_parquet_version(
+    path_str: str,
+    mtime_ns: int,
+    columns: Optional[Tuple[str, ...]] = None,
+    filters: Optional[Tuple[Tuple, ...]] = None
+) -> pd.DataFrame:
+    """Decode a Parquet file; keyed on mtime so a rewritten file is a cache miss."""
+    return pd.read_parquet(
+        path_str,
+        columns=list(columns) if columns is not None else None,
+        filters=list(filters) if filters is not None else None,
+        **PARQUET_READ_OPTIONS
+    )
+
+
+def read_parquet_cached(
+    file_path: Path,
+    columns: Optional[Sequence[str]] = None,
+    filters: Optional[Sequence[Tuple]] = None
+) -> pd.DataFrame:
+    """
+    Read Parquet file, reusing the decoded DataFrame while the file is unchanged.
+    
+    Meant for small files read repeatedly (e.g. Stewart Limits); large layer files
+    should use safe_read_parquet so the process does not keep them alive. Each call
+    returns a copy, so callers may modify the result. Column projection and row
+    filters are pushed down to the Parquet reader, so only the requested columns and
+    matching row groups are decoded.
+    
+    Args:
+        file_path: Path to Parquet file
+        columns: Columns to read (default: all)
+        filters: Row filters in pyarrow DNF form, e.g. [('client', '==', 'CDA')]
+    
+    Returns:
+        DataFrame (a copy of the cached one)
+    """
+    file_path = Path(file_path)
+    return _read_parquet_version(
+        str(file_path.resolve()),
+        file_path.stat().st_mtime_ns,
+        tuple(columns) if columns is not None else None,
+        tuple(tuple(f) for f in filters) if filters is not None else None
+    ).copy()
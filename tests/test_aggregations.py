@@ -0,0 +1,114 @@
+"""
+Tests for latest-sample selection in the aggregations.
+
+Results are compared against the original groupby().idxmax() selection, which
+skips missing dates and keeps the first of the rows tied on the latest date.
+"""
+
+import pandas as pd
+import pytest
+
+from src.processing.aggregations import get_latest_samples, get_machine_status
+from src.processing.classification import COMPONENT_POINTS, MACHINE_THRESHOLDS
+
+
+def _reports(rows):
+    df = pd.DataFrame(
+        rows, columns=['sampleNumber', 'unitId', 'componentName', 'sampleDate', 'report_status']
+    ).astype({'sampleDate': 'datetime64[ns]'})
+    df.insert(0, 'client', 'CDA')
+    return df
+
+
+def _reference_latest(df):
+    """Original selection: first row with the latest date per unit/component."""
+    idx = df.groupby(['unitId', 'componentName'])['sampleDate'].idxmax()
+    return df.loc[idx].reset_index(drop=True)
+
+
+def _reference_machine_status(df):
+    """Original per-unit machine scoring on the idxmax-selected latest samples."""
+    statuses = []
+    for unit in df['unitId'].unique():
+        machine_df = df[df['unitId'] == unit]
+        latest = machine_df.loc[machine_df.groupby('componentName')['sampleDate'].idxmax()]
+        status_counts = latest['report_status'].value_counts().to_dict()
+        machine_score = sum(COMPONENT_POINTS.get(status, 0) * count for status, count in status_counts.items())
+        if machine_score < MACHINE_THRESHOLDS['Normal']:
+            overall_status = 'Normal'
+        elif machine_score >= MACHINE_THRESHOLDS['Anormal']:
+            overall_status = 'Anormal'
+        else:
+            overall_status = 'Alerta'
+        statuses.append({
+            'unit_id': unit,
+            'overall_status': overall_status,
+            'machine_score': machine_score,
+            'total_components': len(latest),
+            'components_normal': status_counts.get('Normal', 0),
+            'components_alerta': status_counts.get('Alerta', 0),
+            'components_anormal': status_counts.get('Anormal', 0),
+        })
+    return pd.DataFrame(statuses)
+
+
+SAME_DAY = _reports([
+    ('S-1', 'CAM_01', 'motor', '2024-01-10', 'Anormal'),
+    ('S-2', 'CAM_01', 'motor', '2024-01-10', 'Normal'),
+    ('S-3', 'CAM_01', 'transmision', '2024-01-05', 'Normal'),
+    ('S-4', 'CAM_01', 'transmision', '2024-01-09', 'Alerta'),
+])
+
+
+@pytest.mark.parametrize('df', [
+    SAME_DAY,
+    # Unsorted input goes through the sort instead of the already-ordered fast path
+    SAME_DAY.iloc[[3, 0, 2, 1]].reset_index(drop=True),
+    _reports([
+        ('S-1', 'CAM_01', 'motor', '2024-01-01', 'Normal'),
+        ('S-2', 'CAM_01', 'motor', '2024-01-10', 'Alerta'),
+        ('S-3', 'CAM_01', 'motor', None, 'Anormal'),
+        ('S-4', 'CAM_01', 'motor', '2024-01-10', 'Normal'),
+        ('S-5', 'CAM_02', 'motor', '2024-01-10', 'Anormal'),
+        ('S-6', 'CAM_02', 'motor', '2024-01-03', 'Normal'),
+    ]),
+])
+def test_latest_samples_match_idxmax_selection(df):
+    latest = get_latest_samples(df)
+
+    pd.testing.assert_frame_equal(latest, _reference_latest(df))
+
+
+def test_first_of_tied_latest_samples_is_kept():
+    latest = get_latest_samples(SAME_DAY)
+
+    assert latest['sampleNumber'].tolist() == ['S-1', 'S-4']
+
+
+def test_missing_dates_are_never_latest():
+    df = _reports([
+        ('S-1', 'CAM_01', 'motor', '2024-01-01', 'Normal'),
+        ('S-2', 'CAM_01', 'motor', None, 'Anormal'),
+    ])
+
+    assert get_latest_samples(df)['sampleNumber'].tolist() == ['S-1']
+
+
+def test_machine_status_matches_idxmax_selection_on_same_day_samples():
+    df = pd.concat([
+        SAME_DAY,
+        _reports([
+            ('S-5', 'CAM_02', 'motor', '2024-01-10', 'Normal'),
+            ('S-6', 'CAM_02', 'motor', '2024-01-10', 'Anormal'),
+        ]),
+    ], ignore_index=True)
+
+    machine_df = get_machine_status(df)
+
+    reference = _reference_machine_status(df)
+    pd.testing.assert_frame_equal(machine_df[reference.columns], reference)
+    # The first of each motor's same-day samples is its latest one
+    machines = machine_df.set_index('unit_id')
+    assert machines.loc['CAM_01', 'components_anormal'] == 1
+    assert machines.loc['CAM_01', 'overall_status'] == 'Alerta'
+    assert machines.loc['CAM_02', 'components_anormal'] == 0
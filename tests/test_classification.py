@@ -0,0 +1,272 @@
+"""
+Tests for the vectorized essay/report classification.
+
+Results are compared against a per-row reference that mirrors the original
+loop-based classify_essays / classify_report implementation.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.processing.classification import (
+    ESSAY_POINTS,
+    REPORT_THRESHOLDS,
+    classify_all_samples,
+    classify_essays,
+    classify_essays_records,
+    classify_machine,
+    classify_report,
+)
+
+
+ESSAYS = ['Hierro', 'Cobre', 'Silicio']
+
+# marginal / condenatorio / critico = 10 / 20 / 30 for every essay except Silicio,
+# which only has a marginal threshold
+LIMITS = {
+    'CDA': {
+        'camion': {
+            'motor': {
+                'Hierro': {'threshold_normal': 10.0, 'threshold_alert': 20.0, 'threshold_critic': 30.0},
+                'Cobre': {'threshold_normal': 10.0, 'threshold_alert': 20.0, 'threshold_critic': 30.0},
+                'Silicio': {'threshold_normal': 10.0, 'threshold_alert': np.nan, 'threshold_critic': np.nan},
+            }
+        }
+    }
+}
+
+
+def _reference_classify(sample, limits, essays_list, points_dict=ESSAY_POINTS):
+    """Original per-row classification: (breached records, severity score)."""
+    client = sample.get('client', '')
+    machine = sample.get('machineName', '')
+    component = sample.get('componentNameNormalized', sample.get('componentName', ''))
+    sel_limits = limits.get(client, {}).get(machine, {}).get(component, {})
+
+    records = []
+    for essay in essays_list:
+        marginal = sel_limits.get(essay, {}).get('threshold_normal', np.nan)
+        condenatorio = sel_limits.get(essay, {}).get('threshold_alert', np.nan)
+        critico = sel_limits.get(essay, {}).get('threshold_critic', np.nan)
+
+        value = sample.get(essay, np.nan)
+        try:
+            value = float(value) if not pd.isna(value) else np.nan
+        except (ValueError, TypeError):
+            continue
+
+        if pd.isna(value) or pd.isna(marginal) or value < marginal:
+            continue
+
+        if value >= critico:
+            threshold, limit = 'Critico', critico
+        elif value >= condenatorio:
+            threshold, limit = 'Condenatorio', condenatorio
+        else:
+            threshold, limit = 'Marginal', marginal
+
+        records.append({
+            'essay': essay,
+            'value': value,
+            'threshold': threshold,
+            'limit': limit,
+            'points': points_dict.get(threshold, 0)
+        })
+
+    return records, sum(record['points'] for record in records)
+
+
+def _sample(client='CDA', **values):
+    sample = {
+        'client': client,
+        'sampleNumber': 'S-1',
+        'unitId': 'CAM_01',
+        'machineName': 'camion',
+        'componentName': 'motor',
+        'componentNameNormalized': 'motor',
+    }
+    sample.update(values)
+    return sample
+
+
+@pytest.mark.parametrize('value, expected', [
+    (9.99, None),
+    (10.0, ('Marginal', 10.0, 1)),
+    (19.99, ('Marginal', 10.0, 1)),
+    (20.0, ('Condenatorio', 20.0, 3)),
+    (29.99, ('Condenatorio', 20.0, 3)),
+    (30.0, ('Critico', 30.0, 5)),
+    (1000.0, ('Critico', 30.0, 5)),
+])
+def test_threshold_boundaries(value, expected):
+    sample = _sample(Hierro=value)
+
+    records, severity_score = classify_essays_records(sample, LIMITS, ['Hierro'])
+
+    assert (records, severity_score) == _reference_classify(sample, LIMITS, ['Hierro'])
+    if expected is None:
+        assert records == []
+        assert severity_score == 0
+    else:
+        threshold, limit, points = expected
+        assert records == [{
+            'essay': 'Hierro', 'value': value, 'threshold': threshold, 'limit': limit, 'points': points
+        }]
+        assert severity_score == points
+
+
+def test_missing_higher_thresholds_fall_back_to_marginal():
+    sample = _sample(Silicio=500.0)
+
+    records, severity_score = classify_essays_records(sample, LIMITS, ['Silicio'])
+
+    assert records == [{'essay': 'Silicio', 'value': 500.0, 'threshold': 'Marginal', 'limit': 10.0, 'points': 1}]
+    assert severity_score == 1
+
+
+@pytest.mark.parametrize('value', [np.nan, None, pd.NA, 'n/a', '<0.1'])
+def test_missing_or_non_numeric_essays_never_breach(value):
+    sample = _sample(Hierro=value, Cobre=25.0)
+
+    records, severity_score = classify_essays_records(sample, LIMITS, ESSAYS)
+
+    assert [record['essay'] for record in records] == ['Cobre']
+    assert severity_score == 3
+    assert (records, severity_score) == _reference_classify(sample, LIMITS, ESSAYS)
+
+
+def test_numeric_strings_are_classified():
+    sample = _sample(Hierro='30')
+
+    records, _ = classify_essays_records(sample, LIMITS, ['Hierro'])
+
+    assert records == _reference_classify(sample, LIMITS, ['Hierro'])[0]
+    assert records[0]['threshold'] == 'Critico'
+
+
+def test_essay_not_in_sample_is_skipped():
+    sample = _sample(Hierro=30.0)
+
+    records, severity_score = classify_essays_records(sample, LIMITS, ['Hierro', 'Sodio'])
+
+    assert [record['essay'] for record in records] == ['Hierro']
+    assert severity_score == 5
+
+
+@pytest.mark.parametrize('sample', [
+    _sample(client='EMIN', Hierro=1000.0, Cobre=1000.0),
+    _sample(machineName='pala', Hierro=1000.0),
+    _sample(componentNameNormalized='hidraulico', Hierro=1000.0),
+])
+def test_missing_limits_never_breach(sample):
+    records, severity_score = classify_essays_records(sample, LIMITS, ESSAYS)
+
+    assert records == []
+    assert severity_score == 0
+
+
+def test_component_name_is_used_without_normalized_column():
+    sample = _sample(Hierro=30.0)
+    del sample['componentNameNormalized']
+
+    records, severity_score = classify_essays_records(sample, LIMITS, ['Hierro'])
+
+    assert severity_score == 5
+    assert records == _reference_classify(sample, LIMITS, ['Hierro'])[0]
+
+
+def test_classify_essays_returns_dataframe():
+    sample = pd.Series(_sample(Hierro=30.0, Cobre=20.0, Silicio=np.nan))
+
+    essays_broken_df, severity_score = classify_essays(sample, LIMITS, ESSAYS)
+
+    records, expected_score = _reference_classify(sample, LIMITS, ESSAYS)
+    assert essays_broken_df.to_dict('records') == records
+    assert severity_score == expected_score
+    assert classify_essays(_sample(), LIMITS, ESSAYS)[0].empty
+
+
+def test_threshold_cache_gives_same_result():
+    threshold_cache = {}
+    first = _sample(Hierro=30.0)
+    second = _sample(Hierro=10.0, Cobre=20.0)
+
+    assert classify_essays_records(first, LIMITS, ESSAYS, threshold_cache=threshold_cache) == \
+        _reference_classify(first, LIMITS, ESSAYS)
+    assert classify_essays_records(second, LIMITS, ESSAYS, threshold_cache=threshold_cache) == \
+        _reference_classify(second, LIMITS, ESSAYS)
+    assert list(threshold_cache) == [('CDA', 'camion', 'motor')]
+
+
+@pytest.mark.parametrize('severity_score, expected', [
+    (0, 'Normal'),
+    (REPORT_THRESHOLDS['Normal'] - 1, 'Normal'),
+    (REPORT_THRESHOLDS['Normal'], 'Alerta'),
+    (REPORT_THRESHOLDS['Anormal'] - 1, 'Alerta'),
+    (REPORT_THRESHOLDS['Anormal'], 'Anormal'),
+])
+def test_classify_report_boundaries(severity_score, expected):
+    assert classify_report(0, severity_score) == expected
+
+
+def test_classify_all_samples_matches_per_row_reference():
+    # Every combination of essay values around the thresholds, plus rows of a
+    # client without limits and missing values
+    grid = [9.99, 10.0, 20.0, 30.0, np.nan]
+    rows = [
+        _sample(sampleNumber=f'CDA-{i}-{j}-{k}', Hierro=h, Cobre=c, Silicio=s)
+        for i, h in enumerate(grid)
+        for j, c in enumerate(grid)
+        for k, s in enumerate(grid)
+    ]
+    rows += [
+        _sample(client='EMIN', sampleNumber='EMIN-1', Hierro=1000.0, Cobre=1000.0, Silicio=1000.0),
+        _sample(client='CDA', sampleNumber='CDA-other', machineName='pala', Hierro=1000.0),
+    ]
+    df = pd.DataFrame(rows)
+
+    classified = classify_all_samples(df, LIMITS, ESSAYS)
+
+    assert len(classified) == len(df)
+    for row, (_, classified_row) in zip(rows, classified.iterrows()):
+        records, severity_score = _reference_classify(row, LIMITS, ESSAYS)
+        assert classified_row['breached_essays'] == records
+        assert classified_row['essays_broken'] == len(records)
+        assert classified_row['severity_score'] == severity_score
+        assert classified_row['report_status'] == classify_report(len(records), severity_score)
+
+    no_limits = classified[classified['sampleNumber'].isin(['EMIN-1', 'CDA-other'])]
+    assert (no_limits['report_status'] == 'Normal').all()
+    assert (no_limits['severity_score'] == 0).all()
+    assert no_limits['breached_essays'].tolist() == [[], []]
+
+
+def test_classify_all_samples_keeps_integer_scores():
+    df = pd.DataFrame([_sample(Hierro=30.0), _sample(client='EMIN', sampleNumber='S-2', Hierro=30.0)])
+
+    classified = classify_all_samples(df, LIMITS, ['Hierro'])
+
+    assert pd.api.types.is_integer_dtype(classified['essays_broken'])
+    assert pd.api.types.is_integer_dtype(classified['severity_score'])
+    assert classified['report_status'].tolist() == ['Alerta', 'Normal']
+
+
+def test_classify_machine_keeps_first_of_tied_latest_samples():
+    df = pd.DataFrame({
+        'client': 'CDA',
+        'unitId': 'CAM_01',
+        'componentName': ['motor', 'motor', 'motor', 'transmision'],
+        'sampleDate': pd.to_datetime(['2024-01-10', '2024-01-10', None, '2024-01-09']),
+        'report_status': ['Anormal', 'Normal', 'Alerta', 'Normal'],
+        'severity_score': [12, 0, 4, 0],
+    })
+
+    result = classify_machine(df, 'CAM_01')
+
+    # Same per-component selection as the original groupby().idxmax() → loc
+    reference = df.loc[df.groupby('componentName')['sampleDate'].idxmax()]
+    assert [detail['status'] for detail in result['component_details']] == \
+        reference['report_status'].tolist() == ['Anormal', 'Normal']
+    assert result['components_anormal'] == 1
+    assert result['latest_sample_date'] == '2024-01-10T00:00:00'